@@ -0,0 +1,79 @@
+"""Microbenchmark for the play matching in sportsref.nba.pbp.parse_play.
+
+Reports plays/sec for sportsref.nba.pbp.match_play, which only tries the
+regexes a play's leading words allow, and for trying every pattern in order
+with re.match (how parse_play used to match plays). The corpus is a file with
+one play description per line, e.g. a season of play-by-play strings; without
+one, a small built-in sample is used.
+
+    python benchmarks/nba_match_play.py [corpus.txt] [-n REPEAT]
+"""
+from __future__ import print_function
+import argparse
+import re
+import time
+
+import sportsref
+
+SAMPLE_DETAILS = [
+    'bryanko01 makes 2-pt shot from 15 ft',
+    'piercpa01 misses 3-pt shot from 25 ft (block by bryanko01)',
+    'bryanko01 makes 2-pt shot at rim (assist by gasolpa01)',
+    'Jump ball: gasolpa01 vs. garneke01 (bryanko01 gains possession)',
+    'Offensive rebound by Team',
+    'Defensive rebound by bryanko01',
+    'bryanko01 makes free throw 1 of 2',
+    'piercpa01 misses technical free throw',
+    'odomla01 enters the game for bryanko01',
+    'Turnover by bryanko01 (bad pass; steal by piercpa01)',
+    'Shooting foul by bryanko01 (drawn by piercpa01)',
+    'Offensive charge foul by piercpa01 (drawn by bryanko01)',
+    'Personal foul by bryanko01 (drawn by piercpa01)',
+    'Loose ball foul by bryanko01 (drawn by piercpa01)',
+    'Los Angeles Lakers full timeout',
+    'Technical foul by Team',
+    'Def 3 sec tech foul by piercpa01',
+    'Violation by Team (delay of game)',
+]
+
+
+def match_sequentially(details):
+    for kind, regex in sportsref.nba.pbp.PLAY_REGEXES:
+        m = re.match(regex.pattern, details, re.I)
+        if m:
+            return kind, m
+    return None, None
+
+
+def bench(func, details, repeat):
+    start = time.time()
+    for _ in range(repeat):
+        for d in details:
+            func(d)
+    return time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('corpus', nargs='?',
+                        help='file with one play description per line')
+    parser.add_argument('-n', '--repeat', type=int, default=200,
+                        help='number of passes over the corpus')
+    args = parser.parse_args()
+
+    if args.corpus:
+        with open(args.corpus) as f:
+            details = [line.rstrip('\n') for line in f if line.strip()]
+    else:
+        details = SAMPLE_DETAILS
+
+    n_plays = args.repeat * len(details)
+    for name, func in [('sequential', match_sequentially),
+                       ('match_play', sportsref.nba.pbp.match_play)]:
+        elapsed = bench(func, details, args.repeat)
+        print('{:>10}: {} plays in {:.2f}s: {:.0f} plays/sec'
+              .format(name, n_plays, elapsed, n_plays / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""Microbenchmark for sportsref.nfl.pbp.parse_play_details.
+
+Reports plays/sec over a corpus of play detail strings, one per line. Without
+a corpus file, a small built-in sample is used. Memoization is turned off so
+that every play is actually parsed; run against two checkouts to compare.
+
+    python benchmarks/nfl_parse_play_details.py [corpus.txt] [-n REPEAT]
+"""
+from __future__ import print_function
+import argparse
+import time
+
+import sportsref
+
+SAMPLE_DETAILS = [
+    'brownan04 kicks off 65 yards, returned by cribbjo01 for 27 yards '
+    '(tackle by sharpra01)',
+    'brownan04 kicks onside 11 yards, recovered by cribbjo01',
+    'Timeout #1 by Cleveland Browns',
+    'akerda01 45 yard field goal good',
+    'akerda01 52 yard field goal no good, blocked by ruudba01, recovered by '
+    'simslo01',
+    'feagije01 punts 45 yards, fair catch by cribbjo01',
+    'feagije01 punts 38 yards, returned by cribbjo01 for 12 yards (tackle by '
+    'sharpra01)',
+    'bradyto01 kneels for -1 yards',
+    'bradyto01 spiked the ball',
+    'gostest01 kicks extra point good',
+    'Two Point Attempt: bradyto01 pass complete to mossra01, conversion '
+    'succeeds',
+    'bradyto01 pass complete short right to mossra01 for 12 yards (tackle by '
+    'sharpra01)',
+    'bradyto01 pass incomplete deep left intended for mossra01',
+    'bradyto01 sacked by sharpra01 for -7 yards',
+    'bradyto01 pass complete short middle to weldwe01 for 8 yards, touchdown',
+    'bradyto01 pass incomplete short left intended for weldwe01 is '
+    'intercepted by reedd.01 at BAL-35 and returned for 20 yards',
+    'Penalty on NWE: False Start, 5 yards (no play)',
+    'Penalty on mankiry01: Holding, 10 yards',
+    'maronla01 left end for 4 yards (tackle by sharpra01)',
+    'maronla01 up the middle for no gain (tackle by sharpra01 and lewira01)',
+    'maronla01 right tackle for 2 yards. maronla01 fumbles (forced by '
+    'lewira01), recovered by reedd.01 at BAL-30',
+    'maronla01 left guard for 1 yard, touchdown',
+    'bradyto01 pass complete to mossra01 for 20 yards. Baltimore Ravens '
+    'challenged the pass completion ruling, and the play was overturned. '
+    'bradyto01 pass incomplete intended for mossra01',
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('corpus', nargs='?',
+                        help='file with one play detail string per line')
+    parser.add_argument('-n', '--repeat', type=int, default=200,
+                        help='number of passes over the corpus')
+    args = parser.parse_args()
+
+    if args.corpus:
+        with open(args.corpus) as f:
+            details = [line.rstrip('\n') for line in f if line.strip()]
+    else:
+        details = SAMPLE_DETAILS
+
+    sportsref.set_option('memoize', False)
+    parse = sportsref.nfl.pbp.parse_play_details
+    start = time.time()
+    for _ in range(args.repeat):
+        for d in details:
+            parse(d)
+    elapsed = time.time() - start
+    n_plays = args.repeat * len(details)
+    print('{} plays in {:.2f}s: {:.0f} plays/sec'
+          .format(n_plays, elapsed, n_plays / elapsed))
+
+
+if __name__ == '__main__':
+    main()
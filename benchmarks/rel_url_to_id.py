@@ -0,0 +1,104 @@
+"""Microbenchmark for sportsref.utils.rel_url_to_id.
+
+Reports hrefs/sec for trying every ID regex in order with re.match (how
+rel_url_to_id used to work), for the routed lookup that only tries the
+regexes for the path segments in the URL, and for rel_url_to_id itself with
+its LRU cache. The corpus is either a file with one href per line, or every
+link in the box scores of an NBA season (fetched through the page cache);
+without either, a small built-in sample is used.
+
+    python benchmarks/rel_url_to_id.py [hrefs.txt] [--nba-season YEAR] \
+        [-n REPEAT]
+"""
+from __future__ import print_function
+import argparse
+import io
+import contextlib
+import re
+import time
+
+import sportsref
+
+SAMPLE_HREFS = [
+    '/players/b/bryanko01.html',
+    '/players/g/gasolpa01.html',
+    '/players/B/BradTo00.htm',
+    '/players/b/bryanko01/gamelog/2010/',
+    '/teams/LAL/2010.html',
+    '/teams/BOS/2010.html',
+    '/boxscores/201006170LAL.html',
+    '/boxscores/index.fcgi?month=6&day=17&year=2010',
+    '/leagues/NBA_2010.html',
+    '/years/2016/',
+    '/coaches/jacksph01c.html',
+    '/officials/crawfjo99r.html',
+    '/awards/mvp.html',
+    '/schools/ucla/',
+    '/friv/playoffs.fcgi?college=ucla',
+    '/play-index/pgl_finder.cgi',
+]
+
+
+def match_sequentially(url):
+    for _, regex in sportsref.utils.ID_REGEXES:
+        match = re.match(regex.pattern, url, re.I)
+        if match:
+            return [_f for _f in match.groups() if _f][0]
+    return url
+
+
+def season_hrefs(year):
+    season = sportsref.nba.Season(year)
+    hrefs = []
+    for bs_id in season.schedule(kind='B')['boxscore_id']:
+        doc = sportsref.nba.BoxScore(bs_id).get_main_doc()
+        hrefs.extend(a.attrib['href'] for a in doc('a[href^="/"]'))
+    return hrefs
+
+
+def bench(func, hrefs, repeat):
+    start = time.time()
+    for _ in range(repeat):
+        for href in hrefs:
+            func(href)
+    return time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('corpus', nargs='?',
+                        help='file with one relative URL per line')
+    parser.add_argument('--nba-season', type=int,
+                        help='use the links in every box score of a season')
+    parser.add_argument('-n', '--repeat', type=int, default=20,
+                        help='number of passes over the corpus')
+    args = parser.parse_args()
+
+    if args.corpus:
+        with open(args.corpus) as f:
+            hrefs = [line.strip() for line in f if line.strip()]
+    elif args.nba_season:
+        hrefs = season_hrefs(args.nba_season)
+    else:
+        hrefs = SAMPLE_HREFS * 100
+    print('{} hrefs ({} distinct)'.format(len(hrefs), len(set(hrefs))))
+
+    routed = sportsref.utils.rel_url_to_id.__wrapped__
+    sportsref.utils.rel_url_to_id.cache_clear()
+    n_hrefs = args.repeat * len(hrefs)
+    # silence the warnings printed for unrecognized URLs
+    with contextlib.redirect_stdout(io.StringIO()):
+        timings = [
+            (name, bench(func, hrefs, args.repeat))
+            for name, func in [('sequential', match_sequentially),
+                               ('routed', routed),
+                               ('memoized', sportsref.utils.rel_url_to_id)]
+        ]
+    for name, elapsed in timings:
+        print('{:>10}: {} hrefs in {:.2f}s: {:.0f} hrefs/sec'
+              .format(name, n_hrefs, elapsed, n_hrefs / elapsed))
+    print(sportsref.utils.rel_url_to_id.cache_info())
+
+
+if __name__ == '__main__':
+    main()
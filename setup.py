@@ -18,5 +18,8 @@ setup(name='sportsref',
           'pyquery',
           'requests',
           'scipy',
-      ]
+      ],
+      extras_require={
+          'warehouse': ['pyarrow'],
+      }
       )
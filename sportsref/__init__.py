@@ -8,6 +8,6 @@ SITE_ABBREV = {
 }
 
 from sportsref.options import get_option, set_option
-from sportsref import decorators, utils, nfl, nba
+from sportsref import cache, decorators, utils, nfl, nba, warehouse, crawl
 
-__all__ = ['decorators', 'utils', 'nfl', 'nba', 'get_option', 'set_option', 'SITE_ABBREV']
+__all__ = ['cache', 'decorators', 'utils', 'nfl', 'nba', 'warehouse', 'crawl', 'get_option', 'set_option', 'SITE_ABBREV']
@@ -0,0 +1,49 @@
+"""Asynchronous counterparts of the functions in sportsref.utils, for use
+from code that already runs an event loop. Requires Python 3.7+."""
+import asyncio
+import collections
+import concurrent.futures
+
+import sportsref
+
+
+async def aget_html_many(urls, max_workers=None, return_exceptions=False):
+    """Gets the HTML for many URLs concurrently with `get_html`, yielding each
+    page as soon as it is available. Like
+    :func:`sportsref.utils.get_html_many`, but awaits the pages instead of
+    blocking on them.
+
+    :urls: iterable of absolute URLs; duplicates are only fetched once.
+    :max_workers: maximum number of requests in flight at once. Defaults to
+        the 'pool_size' option.
+    :return_exceptions: if True, an exception raised fetching a URL is
+        yielded in place of its HTML instead of being raised.
+    :returns: async generator of (url, html) tuples in completion order.
+    """
+    if max_workers is None:
+        max_workers = sportsref.get_option('pool_size')
+    loop = asyncio.get_running_loop()
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+
+    async def fetch(url):
+        try:
+            html = await loop.run_in_executor(
+                executor, sportsref.utils.get_html, url
+            )
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            html = e
+        return url, html
+
+    tasks = [asyncio.ensure_future(fetch(url))
+             for url in collections.OrderedDict.fromkeys(urls)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # stop queued requests if the caller stops early or a request fails;
+        # cancelling a task cancels its call in the executor
+        for task in tasks:
+            task.cancel()
+        executor.shutdown(wait=False)
@@ -0,0 +1,495 @@
+from __future__ import print_function
+import atexit
+import getpass
+import gzip
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+import appdirs
+import pandas as pd
+
+import sportsref
+
+CACHE_DIR = appdirs.user_cache_dir('sportsref', getpass.getuser())
+
+# pages are stored gzip-compressed under CACHE_DIR/pages/ab/cd/abcd....gz,
+# named by the SHA-1 of their contents, and looked up through a SQLite index
+PAGES_DIRNAME = 'pages'
+INDEX_FILENAME = 'index.sqlite'
+
+# parsed results of memoized methods are pickled under CACHE_DIR/results/
+RESULTS_DIRNAME = 'results'
+
+# part of the key of every stored result; bump it whenever a change to the
+# parsing code changes what the persisted methods return
+PARSE_VERSION = 1
+
+# when a size budget is set, enforce it after every this many writes; access
+# times and hit/miss counts are also written to the index every this many
+# accesses
+PRUNE_EVERY = 50
+
+# ORDER BY clauses listing pages in the order they should be evicted
+_EVICTION_ORDERS = {
+    'lru': 'accessed_at ASC',
+    'age_size': '(:now - fetched_at) * size DESC',
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT PRIMARY KEY,
+    hash TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    sport_id TEXT,
+    size INTEGER NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    accessed_at REAL
+);
+CREATE INDEX IF NOT EXISTS pages_hash ON pages (hash);
+CREATE TABLE IF NOT EXISTS counters (
+    sport_id TEXT PRIMARY KEY,
+    hits INTEGER NOT NULL DEFAULT 0,
+    misses INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+class PageCache(object):
+
+    """Content-addressed, compressed on-disk cache of HTML pages with a SQLite
+    index of url -> (hash, fetched_at, sport_id, size, validators)."""
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.pages_dir = os.path.join(cache_dir, PAGES_DIRNAME)
+        self.index_path = os.path.join(cache_dir, INDEX_FILENAME)
+        if not os.path.isdir(self.pages_dir):
+            os.makedirs(self.pages_dir)
+        self._local = threading.local()
+        self._n_writes = 0
+        # accesses not yet written to the index, kept per process
+        self._access_lock = threading.Lock()
+        self._reset_accesses()
+        atexit.register(self.flush_accesses)
+
+    def _reset_accesses(self):
+        self._access_pid = os.getpid()
+        self._accessed_at = {}  # url -> time of the last access
+        self._counts = {}  # sport_id -> [hits, misses]
+        self._n_accesses = 0
+
+    def _conn(self):
+        """Returns a SQLite connection for the current thread and process."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.index_path, timeout=60,
+                                   isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(_SCHEMA)
+            columns = [r['name'] for r in
+                       conn.execute('PRAGMA table_info(pages)')]
+            if 'accessed_at' not in columns:
+                # index created before accessed_at was tracked
+                try:
+                    conn.execute(
+                        'ALTER TABLE pages ADD COLUMN accessed_at REAL'
+                    )
+                except sqlite3.OperationalError:
+                    pass  # added concurrently by another connection
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _blob_path(self, content_hash):
+        return os.path.join(self.pages_dir, content_hash[:2],
+                            content_hash[2:4], content_hash + '.gz')
+
+    def lookup(self, url):
+        """Returns the index entry for a URL.
+
+        :url: the absolute URL of the page.
+        :returns: dict with keys url, hash, fetched_at, sport_id, size, etag,
+            and last_modified; None if the URL is not cached.
+        """
+        row = self._conn().execute(
+            'SELECT * FROM pages WHERE url = ?', (url,)
+        ).fetchone()
+        if row is None:
+            row = self._import_legacy(url)
+        return dict(row) if row is not None else None
+
+    def read(self, entry):
+        """Reads the HTML for an index entry returned by `lookup`.
+
+        :entry: the index entry.
+        :returns: a string of HTML, or None if the page's file is missing.
+        """
+        try:
+            with open(self._blob_path(entry['hash']), 'rb') as f:
+                data = f.read()
+        except (IOError, OSError):
+            return None
+        return gzip.decompress(data).decode('utf-8', errors='replace')
+
+    def write(self, url, text, sport_id=None, validators=None,
+              fetched_at=None):
+        """Stores a page and points the URL's index entry at it.
+
+        :url: the absolute URL of the page.
+        :text: the HTML of the page.
+        :sport_id: the sport ID of the page's site, if any.
+        :validators: dict with the 'etag'/'last_modified' of the response.
+        :fetched_at: when the page was fetched; defaults to now.
+        :returns: the hash of the page's contents.
+        """
+        validators = validators or {}
+        data = text.encode('utf-8')
+        content_hash = hashlib.sha1(data).hexdigest()
+        path = self._blob_path(content_hash)
+        if os.path.isfile(path):
+            size = os.path.getsize(path)
+        else:
+            compressed = gzip.compress(data)
+            size = len(compressed)
+            if not os.path.isdir(os.path.dirname(path)):
+                try:
+                    os.makedirs(os.path.dirname(path))
+                except OSError:
+                    pass  # created concurrently
+            tmp_path = '{}.{}.{}.tmp'.format(
+                path, os.getpid(), threading.current_thread().ident
+            )
+            with open(tmp_path, 'wb') as f:
+                f.write(compressed)
+            os.rename(tmp_path, path)
+
+        conn = self._conn()
+        old = conn.execute('SELECT hash FROM pages WHERE url = ?',
+                           (url,)).fetchone()
+        now = time.time()
+        conn.execute(
+            'INSERT OR REPLACE INTO pages '
+            '(url, hash, fetched_at, sport_id, size, etag, last_modified, '
+            'accessed_at) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (url, content_hash,
+             now if fetched_at is None else fetched_at,
+             sport_id, size,
+             validators.get('etag'), validators.get('last_modified'), now)
+        )
+        if old is not None and old['hash'] != content_hash:
+            self._remove_orphan(old['hash'])
+
+        # keep the cache within its budget, if it has one
+        self._n_writes += 1
+        has_budget = (sportsref.get_option('cache_max_bytes') is not None or
+                      sportsref.get_option('cache_max_entries') is not None)
+        if has_budget and self._n_writes % PRUNE_EVERY == 0:
+            self.prune()
+        return content_hash
+
+    def touch(self, url, validators=None):
+        """Marks a cached page as freshly fetched, e.g. after a 304.
+
+        :url: the absolute URL of the page.
+        :validators: new 'etag'/'last_modified' values, if any were sent.
+        :returns: None
+        """
+        validators = validators or {}
+        self._conn().execute(
+            'UPDATE pages SET fetched_at = ?, '
+            'etag = COALESCE(?, etag), '
+            'last_modified = COALESCE(?, last_modified) '
+            'WHERE url = ?',
+            (time.time(), validators.get('etag'),
+             validators.get('last_modified'), url)
+        )
+
+    def record_access(self, url, sport_id, hit):
+        """Records a cache access for LRU eviction and hit rate stats.
+        Accesses are kept in memory and written to the index in batches.
+
+        :url: the absolute URL of the page.
+        :sport_id: the sport ID of the page's site, if any.
+        :hit: True if the page was served without downloading it.
+        :returns: None
+        """
+        with self._access_lock:
+            if self._access_pid != os.getpid():
+                # forked; the parent writes its own pending accesses
+                self._reset_accesses()
+            self._accessed_at[url] = time.time()
+            counts = self._counts.setdefault(sport_id or '', [0, 0])
+            counts[0 if hit else 1] += 1
+            self._n_accesses += 1
+            do_flush = self._n_accesses >= PRUNE_EVERY
+        if do_flush:
+            self.flush_accesses()
+
+    def flush_accesses(self):
+        """Writes the accesses recorded by `record_access` to the index in a
+        single transaction.
+
+        :returns: None
+        """
+        with self._access_lock:
+            if self._access_pid != os.getpid():
+                self._reset_accesses()
+            accessed_at, counts = self._accessed_at, self._counts
+            self._reset_accesses()
+        if not accessed_at and not counts:
+            return
+        conn = self._conn()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.executemany(
+                'UPDATE pages SET accessed_at = ? WHERE url = ?',
+                [(t, url) for url, t in accessed_at.items()]
+            )
+            conn.executemany(
+                'INSERT OR IGNORE INTO counters (sport_id) VALUES (?)',
+                [(sport_id,) for sport_id in counts]
+            )
+            conn.executemany(
+                'UPDATE counters SET hits = hits + ?, misses = misses + ? '
+                'WHERE sport_id = ?',
+                [(hits, misses, sport_id)
+                 for sport_id, (hits, misses) in counts.items()]
+            )
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+
+    def prune(self, max_bytes=None, max_entries=None, eviction=None):
+        """Evicts pages until the cache is within its budget.
+
+        :max_bytes: maximum total size of the stored pages. Defaults to the
+            'cache_max_bytes' option; None means unlimited.
+        :max_entries: maximum number of cached URLs. Defaults to the
+            'cache_max_entries' option; None means unlimited.
+        :eviction: 'lru' to evict least recently used pages first, or
+            'age_size' to evict pages with the largest age times size first.
+            Defaults to the 'cache_eviction' option.
+        :returns: number of URLs evicted.
+        """
+        if max_bytes is None:
+            max_bytes = sportsref.get_option('cache_max_bytes')
+        if max_entries is None:
+            max_entries = sportsref.get_option('cache_max_entries')
+        if eviction is None:
+            eviction = sportsref.get_option('cache_eviction')
+        if eviction not in _EVICTION_ORDERS:
+            raise ValueError('unknown cache eviction policy "{}"'
+                             .format(eviction))
+        if max_bytes is None and max_entries is None:
+            return 0
+
+        self.flush_accesses()
+        conn = self._conn()
+        n_entries, n_bytes = self._totals()
+        if ((max_entries is None or n_entries <= max_entries) and
+                (max_bytes is None or n_bytes <= max_bytes)):
+            return 0
+
+        candidates = conn.execute(
+            'SELECT url, hash, size FROM pages ORDER BY {}'
+            .format(_EVICTION_ORDERS[eviction]),
+            {'now': time.time()}
+        ).fetchall()
+        n_evicted = 0
+        for row in candidates:
+            if ((max_entries is None or n_entries <= max_entries) and
+                    (max_bytes is None or n_bytes <= max_bytes)):
+                break
+            conn.execute('DELETE FROM pages WHERE url = ?', (row['url'],))
+            if self._remove_orphan(row['hash']):
+                n_bytes -= row['size']
+            n_entries -= 1
+            n_evicted += 1
+        return n_evicted
+
+    def stats(self):
+        """Returns statistics about the cache for each sport.
+
+        :returns: DataFrame indexed by sport ID with columns entries, bytes,
+            hits, misses, and hit_rate.
+        """
+        self.flush_accesses()
+        conn = self._conn()
+        sizes = pd.read_sql_query(
+            'SELECT sport_id, COUNT(*) AS entries, SUM(size) AS bytes '
+            'FROM pages GROUP BY sport_id', conn
+        )
+        counters = pd.read_sql_query('SELECT * FROM counters', conn)
+        for df in (sizes, counters):
+            df['sport_id'] = df['sport_id'].fillna('').replace('', 'other')
+        df = pd.merge(sizes, counters, on='sport_id', how='outer')
+        df = df.groupby('sport_id').sum()
+        df = df[['entries', 'bytes', 'hits', 'misses']].astype(int)
+        df['hit_rate'] = df['hits'] / (df['hits'] + df['misses'])
+        return df
+
+    def _totals(self):
+        """Returns the number of cached URLs and the bytes used by their
+        pages (pages shared by several URLs are only counted once)."""
+        conn = self._conn()
+        n_entries = conn.execute('SELECT COUNT(*) FROM pages').fetchone()[0]
+        n_bytes = conn.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM '
+            '(SELECT MAX(size) AS size FROM pages GROUP BY hash)'
+        ).fetchone()[0]
+        return n_entries, n_bytes
+
+    def _remove_orphan(self, content_hash):
+        """Deletes a page file if no URL in the index refers to it.
+
+        :returns: True if the file was deleted.
+        """
+        still_used = self._conn().execute(
+            'SELECT 1 FROM pages WHERE hash = ? LIMIT 1', (content_hash,)
+        ).fetchone()
+        if still_used:
+            return False
+        try:
+            os.remove(self._blob_path(content_hash))
+        except OSError:
+            pass
+        return True
+
+    def _import_legacy(self, url):
+        """Moves a page from the old flat cache layout (one uncompressed file
+        per URL, named by the MD5 of the URL) into this cache.
+
+        :returns: the new index row, or None if there was no legacy file.
+        """
+        url_hash = hashlib.md5(url.encode(errors='replace')).hexdigest()
+        filename = os.path.join(self.cache_dir, url_hash)
+        if not os.path.isfile(filename):
+            return None
+        with open(filename, 'rb') as f:
+            text = f.read().decode('utf-8', errors='replace')
+        validators = {}
+        meta_filename = '{}.meta'.format(filename)
+        if os.path.isfile(meta_filename):
+            with open(meta_filename, 'r') as f:
+                validators = json.load(f)
+        self.write(url, text,
+                   sport_id=sportsref.decorators.sport_id_for_url(url),
+                   validators=validators,
+                   fetched_at=os.path.getmtime(filename))
+        for fn in (filename, meta_filename):
+            try:
+                os.remove(fn)
+            except OSError:
+                pass
+        return self._conn().execute(
+            'SELECT * FROM pages WHERE url = ?', (url,)
+        ).fetchone()
+
+
+class ResultCache(object):
+
+    """On-disk cache of pickled results of parsing methods, each stored with
+    the URLs and content hashes of the pages it was parsed from. See
+    :func:`sportsref.decorators.memoize`."""
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.results_dir = os.path.join(cache_dir, RESULTS_DIRNAME)
+
+    def _path(self, key):
+        key_hash = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.results_dir, key_hash[:2], key_hash + '.pkl')
+
+    def get(self, key):
+        """Reads a stored result.
+
+        :key: string identifying the result.
+        :returns: tuple of the dict mapping URLs to the hashes of the pages the
+            result depends on, and the result; None if it isn't stored.
+        """
+        try:
+            with open(self._path(key), 'rb') as f:
+                stored_key, deps, value = pickle.load(f)
+        except Exception:
+            # missing, or unreadable (e.g. pickled by another pandas version)
+            return None
+        if stored_key != key:
+            return None
+        return deps, value
+
+    def put(self, key, deps, value):
+        """Stores a result.
+
+        :key: string identifying the result.
+        :deps: dict mapping the URLs of the pages the result was parsed from
+            to the hashes of their contents.
+        :value: the result.
+        :returns: None
+        """
+        path = self._path(key)
+        if not os.path.isdir(os.path.dirname(path)):
+            try:
+                os.makedirs(os.path.dirname(path))
+            except OSError:
+                pass  # created concurrently
+        tmp_path = '{}.{}.{}.tmp'.format(
+            path, os.getpid(), threading.current_thread().ident
+        )
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((key, deps, value), f, pickle.HIGHEST_PROTOCOL)
+        os.rename(tmp_path, path)
+
+
+_page_cache = None
+_page_cache_lock = threading.Lock()
+_result_cache = None
+
+
+def get_page_cache():
+    """Returns the PageCache for the user cache directory.
+
+    :returns: PageCache
+    """
+    global _page_cache
+    with _page_cache_lock:
+        if _page_cache is None:
+            _page_cache = PageCache()
+        return _page_cache
+
+
+def get_result_cache():
+    """Returns the ResultCache for the user cache directory.
+
+    :returns: ResultCache
+    """
+    global _result_cache
+    with _page_cache_lock:
+        if _result_cache is None:
+            _result_cache = ResultCache()
+        return _result_cache
+
+
+def prune(max_bytes=None, max_entries=None, eviction=None):
+    """Evicts pages from the user's page cache until it is within budget. See
+    :meth:`PageCache.prune`.
+
+    :returns: number of URLs evicted.
+    """
+    return get_page_cache().prune(max_bytes, max_entries, eviction)
+
+
+def stats():
+    """Returns hit rate, bytes and entries per sport for the user's page
+    cache. See :meth:`PageCache.stats`.
+
+    :returns: DataFrame indexed by sport ID.
+    """
+    return get_page_cache().stats()
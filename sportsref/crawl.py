@@ -0,0 +1,283 @@
+"""Bulk crawling of every game in a season or date range.
+
+Fetching and parsing run as separate pipeline stages. Pages are fetched by a
+pool of threads in this process, at the throttled request rate, into the
+page cache. Each game whose pages are all cached is then parsed by a pool of
+worker processes that read the pages from the cache. A bounded queue between
+the stages keeps fetching from running arbitrarily far ahead of parsing.
+"""
+from __future__ import print_function
+import concurrent.futures
+import datetime
+import os
+import pickle
+import queue
+import threading
+import time
+
+import pandas as pd
+
+import sportsref
+
+# how often to report progress, in games
+REPORT_EVERY = 25
+
+
+def _season_of_date(sport, date):
+    """Returns the season a game on the given date belongs to."""
+    if sport == 'nfl':
+        return date.year - 1 if date.month <= 3 else date.year
+    else:
+        return date.year + 1 if date.month >= 9 else date.year
+
+
+def _game_date(boxscore_id):
+    return datetime.datetime.strptime(boxscore_id[:8], '%Y%m%d').date()
+
+
+def _season_boxscore_ids(sport, season):
+    """Returns the IDs of the games in a season."""
+    if sport == 'nfl':
+        return list(sportsref.nfl.boxscores.get_season_boxscores_IDs(season))
+    elif sport == 'nba':
+        schedule = sportsref.nba.Season(season).schedule(kind='B')
+        return list(schedule['boxscore_id'])
+    raise ValueError('unknown sport "{}"'.format(sport))
+
+
+def boxscore_ids(sport, season=None, start=None, end=None):
+    """Returns the IDs of the games in a season or between two dates.
+
+    :sport: 'nfl' or 'nba'.
+    :season: the year of the season; if None, `start` and `end` are used.
+    :start: datetime.date of the first day of games to include.
+    :end: datetime.date of the last day of games to include.
+    :returns: list of boxscore IDs.
+    """
+    if season is not None:
+        return _season_boxscore_ids(sport, season)
+    if start is None or end is None:
+        raise ValueError('either season or both start and end are required')
+    ids = []
+    for yr in range(_season_of_date(sport, start),
+                    _season_of_date(sport, end) + 1):
+        season_ids = _season_boxscore_ids(sport, yr)
+        ids.extend(bs_id for bs_id in season_ids
+                   if start <= _game_date(bs_id) <= end)
+    return ids
+
+
+def _game_urls(sport, boxscore_id):
+    """Returns the URLs of the pages parsed for a game."""
+    if sport == 'nfl':
+        return ['{}/boxscores/{}.htm'.format(sportsref.nfl.BASE_URL,
+                                             boxscore_id)]
+    else:
+        return ['{}/boxscores/{}.html'.format(sportsref.nba.BASE_URL,
+                                              boxscore_id),
+                '{}/boxscores/pbp/{}.html'.format(sportsref.nba.BASE_URL,
+                                                  boxscore_id)]
+
+
+def _init_worker(process_lock, last_time, last_times):
+    # share the request throttle with the crawling process, in case a parser
+    # needs a page that wasn't fetched ahead of time
+    sportsref.utils.throttle_process_lock = process_lock
+    sportsref.utils.last_request_time = last_time
+    sportsref.utils.last_request_times = last_times
+
+
+def _parse_game(sport, boxscore_id, methods):
+    """Runs in a worker process. Parses a game with the given BoxScore
+    methods.
+
+    :returns: dict mapping each method name to its DataFrame, or to the
+        repr of the exception it raised.
+    """
+    bs = getattr(sportsref, sport).BoxScore(boxscore_id)
+    results = {}
+    for method in methods:
+        try:
+            df = getattr(bs, method)().copy()
+            if 'boxscore_id' not in df.columns:
+                df['boxscore_id'] = boxscore_id
+            results[method] = df
+        except Exception as e:
+            results[method] = repr(e)
+    return results
+
+
+def _fetch_stage(sport, ids, ready, max_workers, stop):
+    """Fetches the pages of each game into the page cache and puts the
+    game's ID in `ready` once they are all cached; puts None when done."""
+    game_urls = {bs_id: _game_urls(sport, bs_id) for bs_id in ids}
+    remaining = {bs_id: len(urls) for bs_id, urls in game_urls.items()}
+    url_games = {}
+    for bs_id, urls in game_urls.items():
+        for url in urls:
+            url_games.setdefault(url, []).append(bs_id)
+    try:
+        pages = sportsref.utils.get_html_many(
+            url_games, max_workers=max_workers, return_exceptions=True
+        )
+        for url, html in pages:
+            if isinstance(html, Exception):
+                print('WARNING: could not fetch {}: {!r}'.format(url, html))
+            for bs_id in url_games[url]:
+                remaining[bs_id] -= 1
+                if not remaining[bs_id]:
+                    # blocks while the parsers are too far behind
+                    ready.put(bs_id)
+            if stop.is_set():
+                break
+    finally:
+        ready.put(None)
+
+
+def _failures(game_results):
+    """Returns a dict of {method: repr of exception} for the methods that
+    failed in a game's results from _parse_game."""
+    return {method: df for method, df in game_results.items()
+            if isinstance(df, str)}
+
+
+def _checkpoint_path(checkpoint_dir, boxscore_id):
+    return os.path.join(checkpoint_dir, '{}.pkl'.format(boxscore_id))
+
+
+def crawl(sport, season=None, start=None, end=None, methods=('pbp',),
+          checkpoint_dir=None, n_procs=None, fetch_workers=None,
+          queue_size=None):
+    """Fetches and parses every game in a season or between two dates.
+
+    Games already in `checkpoint_dir` are not crawled again, so an
+    interrupted crawl can be resumed by calling this again with the same
+    directory. Games for which any method failed are not checkpointed, so
+    they are retried when the crawl is resumed. Progress and throughput are
+    printed as games are parsed.
+
+    :sport: 'nfl' or 'nba'.
+    :season: the year of the season; if None, `start` and `end` are used.
+    :start: datetime.date of the first day of games to include.
+    :end: datetime.date of the last day of games to include.
+    :methods: names of the BoxScore methods returning the DataFrames to
+        collect, e.g. ('pbp', 'player_stats'). Defaults to ('pbp',).
+    :checkpoint_dir: directory where each game's results are saved as soon as
+        it is parsed; if None, results are only kept in memory.
+    :n_procs: number of parsing processes. Defaults to the number of CPUs.
+    :fetch_workers: number of requests in flight at once. Defaults to the
+        'pool_size' option.
+    :queue_size: maximum number of fetched games waiting to be parsed.
+        Defaults to four per parsing process.
+    :returns: tuple of (frames, failed). frames is a dict mapping each
+        method name to a DataFrame of its results for all of the games that
+        were parsed without errors; failed is a dict mapping the ID of each
+        game that was not to a dict of {method: repr of the exception} for
+        the methods that failed.
+    """
+    n_procs = n_procs or os.cpu_count() or 1
+    queue_size = queue_size or 4 * n_procs
+    ids = boxscore_ids(sport, season, start, end)
+
+    results = {}  # boxscore_id -> {method: DataFrame}
+    failed = {}  # boxscore_id -> {method: repr of exception}
+    if checkpoint_dir is not None:
+        if not os.path.isdir(checkpoint_dir):
+            os.makedirs(checkpoint_dir)
+        for bs_id in ids:
+            path = _checkpoint_path(checkpoint_dir, bs_id)
+            if os.path.isfile(path):
+                with open(path, 'rb') as f:
+                    game_results = pickle.load(f)
+                # checkpoints from older versions may hold failed methods
+                if (not _failures(game_results) and
+                        all(m in game_results for m in methods)):
+                    results[bs_id] = game_results
+    todo = [bs_id for bs_id in ids if bs_id not in results]
+    if results:
+        print('resuming: {} of {} games already crawled'
+              .format(len(results), len(ids)))
+
+    ready = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    fetcher = threading.Thread(
+        target=_fetch_stage,
+        args=(sport, todo, ready, fetch_workers, stop)
+    )
+    fetcher.daemon = True
+    fetcher.start()
+
+    start_time = time.time()
+    n_parsed = 0
+    pool = concurrent.futures.ProcessPoolExecutor(
+        max_workers=n_procs, initializer=_init_worker,
+        initargs=(sportsref.utils.throttle_process_lock,
+                  sportsref.utils.last_request_time,
+                  sportsref.utils.last_request_times)
+    )
+    pending = {}
+    try:
+        fetching = True
+        while fetching or pending:
+            # keep every parser busy while there are fetched games
+            while fetching and len(pending) < 2 * n_procs:
+                try:
+                    bs_id = ready.get(timeout=None if not pending else 0.1)
+                except queue.Empty:
+                    break
+                if bs_id is None:
+                    fetching = False
+                    break
+                future = pool.submit(_parse_game, sport, bs_id, methods)
+                pending[future] = bs_id
+            if not pending:
+                continue
+            done, _ = concurrent.futures.wait(
+                pending, timeout=0.1,
+                return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                bs_id = pending.pop(future)
+                game_results = future.result()
+                errors = _failures(game_results)
+                for method, error in errors.items():
+                    print('WARNING: {} failed for {}: {}'
+                          .format(method, bs_id, error))
+                if errors:
+                    failed[bs_id] = errors
+                else:
+                    results[bs_id] = game_results
+                if checkpoint_dir is not None and not errors:
+                    path = _checkpoint_path(checkpoint_dir, bs_id)
+                    with open(path + '.tmp', 'wb') as f:
+                        pickle.dump(game_results, f,
+                                    pickle.HIGHEST_PROTOCOL)
+                    os.rename(path + '.tmp', path)
+                n_parsed += 1
+                if n_parsed % REPORT_EVERY == 0 or n_parsed == len(todo):
+                    elapsed = time.time() - start_time
+                    print('parsed {} of {} games ({:.1f} games/min)'.format(
+                        n_parsed, len(todo), 60 * n_parsed / elapsed
+                    ))
+    finally:
+        stop.set()
+        # unblock the fetcher if it's waiting on a full queue
+        while fetcher.is_alive():
+            try:
+                ready.get_nowait()
+            except queue.Empty:
+                fetcher.join(0.1)
+        # don't start the parses still queued
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=True)
+
+    frames = {}
+    for method in methods:
+        dfs = [results[bs_id][method] for bs_id in ids
+               if bs_id in results and method in results[bs_id]]
+        frames[method] = (pd.concat(dfs, ignore_index=True, sort=False)
+                          if dfs else pd.DataFrame())
+    if failed:
+        print('WARNING: {} of {} games failed'.format(len(failed), len(ids)))
+    return frames, failed
@@ -2,17 +2,18 @@ from __future__ import print_function
 from future import standard_library
 standard_library.install_aliases()
 
-import codecs
+import collections
+import contextlib
 import copy
 import datetime
 import functools
-import getpass
-import hashlib
 import os
+import pickle
 import re
+import threading
 import time
+import zlib
 
-import appdirs
 from boltons import funcutils
 import mementos
 import pandas as pd
@@ -92,53 +93,109 @@ def _days_valid_cfb(url):
     return 365
 
 
+def sport_id_for_url(url):
+    """Returns the sport ID (e.g. 'pfr' or 'bkref') of the site a URL is on.
+
+    :url: the absolute URL of a page.
+    :returns: the sport ID, or None if the site isn't known.
+    """
+    for a_base_url, a_sport_id in sportsref.SITE_ABBREV.items():
+        if url.startswith(a_base_url):
+            return a_sport_id
+    return None
+
+
+def _is_fresh(url, entry, sport_id):
+    """Returns True if a page cache entry is recent enough to be used."""
+    if not (sport_id and entry):
+        return False
+    cur_time = int(time.time())
+    mod_time = int(entry['fetched_at'])
+    days_since_mod = datetime.timedelta(seconds=(cur_time - mod_time)).days
+    days_cache_valid = globals()['_days_valid_{}'.format(sport_id)](url)
+    return days_since_mod < days_cache_valid
+
+
+# per-thread stack of dicts collecting the URLs (and content hashes) of the
+# pages read while computing each memoized result that is in progress
+_dependencies = threading.local()
+
+
+def _record_dependencies(deps):
+    for recorder in getattr(_dependencies, 'stack', ()):
+        recorder.update(deps)
+
+
+@contextlib.contextmanager
+def _recording_dependencies():
+    stack = _dependencies.__dict__.setdefault('stack', [])
+    deps = {}
+    stack.append(deps)
+    try:
+        yield deps
+    finally:
+        stack.pop()
+
+
 def cache(func):
     """Caches the HTML returned by the specified function `func`. Caches it in
-    the user cache determined by the appdirs package.
-    """
+    the user cache determined by the appdirs package; see
+    :class:`sportsref.cache.PageCache`.
+
+    `func` is called as `func(url, headers)`, where `headers` holds conditional
+    request headers when a stale page is being revalidated. It must return a
+    tuple of the HTML (None if the server replied 304 Not Modified) and a dict
+    of the response's 'etag'/'last_modified' validators, which are stored with
+    the cached page.
 
-    CACHE_DIR = appdirs.user_cache_dir('sportsref', getpass.getuser())
-    if not os.path.isdir(CACHE_DIR):
-        os.makedirs(CACHE_DIR)
+    The pages returned are recorded as dependencies of the memoized results
+    being computed; see :func:`memoize`.
+    """
 
-    @funcutils.wraps(func)
+    @funcutils.wraps(func, injected=['headers'])
     def wrapper(url):
-        # hash based on the URL
-        file_hash = hashlib.md5()
-        encoded_url = url.encode(errors='replace')
-        file_hash.update(encoded_url)
-        file_hash = file_hash.hexdigest()
-        filename = '{}/{}'.format(CACHE_DIR, file_hash)
-
-        sport_id = None
-        for a_base_url, a_sport_id in sportsref.SITE_ABBREV.items():
-            if url.startswith(a_base_url):
-                sport_id = a_sport_id
-                break
-        else:
+        page_cache = sportsref.cache.get_page_cache()
+
+        sport_id = sport_id_for_url(url)
+        if not sport_id:
             print('No sport ID found for {}, not able to check cache'.format(url))
 
         # check whether cache is valid or stale
-        file_exists = os.path.isfile(filename)
-        if sport_id and file_exists:
-            cur_time = int(time.time())
-            mod_time = int(os.path.getmtime(filename))
-            days_since_mod = datetime.timedelta(seconds=(cur_time - mod_time)).days
-            days_cache_valid = globals()['_days_valid_{}'.format(sport_id)](url)
-            cache_is_valid = days_since_mod < days_cache_valid
-        else:
-            cache_is_valid = False
-
-        # if file found and cache is valid, read from file
+        entry = page_cache.lookup(url)
+        cache_is_valid = _is_fresh(url, entry, sport_id)
+
+        # if page found and cache is valid, read from cache
         allow_caching = sportsref.get_option('cache')
-        if file_exists and cache_is_valid and allow_caching:
-            with codecs.open(filename, 'r', encoding='utf-8', errors='replace') as f:
-                text = f.read()
+        text = None
+        if entry and cache_is_valid and allow_caching:
+            text = page_cache.read(entry)
+            if text is not None:
+                page_cache.record_access(url, sport_id, hit=True)
+                _record_dependencies({url: entry['hash']})
         # otherwise, execute function and cache results
-        else:
-            text = func(url)
-            with codecs.open(filename, 'w+', encoding='utf-8') as f:
-                f.write(text)
+        if text is None:
+            # revalidate a stale page using the validators stored with it
+            headers = {}
+            if entry:
+                if entry['etag']:
+                    headers['If-None-Match'] = entry['etag']
+                if entry['last_modified']:
+                    headers['If-Modified-Since'] = entry['last_modified']
+            text, validators = func(url, headers)
+            # 304 Not Modified: the cached page is still good, so just reset
+            # its age
+            if text is None:
+                text = page_cache.read(entry)
+                if text is not None:
+                    page_cache.touch(url, validators)
+                    page_cache.record_access(url, sport_id, hit=True)
+                    _record_dependencies({url: entry['hash']})
+                    return text
+                # the cached file went missing, so fetch it unconditionally
+                text, validators = func(url, {})
+            content_hash = page_cache.write(url, text, sport_id, validators)
+            page_cache.record_access(url, sport_id, hit=False)
+            _record_dependencies({url: content_hash})
         return text
 
     return wrapper
@@ -146,13 +203,19 @@ def cache(func):
 
 def get_class_instance_key(cls, args, kwargs):
     """
-    Returns a unique identifier for a class instantiation.
+    Returns a unique identifier for a class instantiation, based on the
+    values of the arguments (or their ids, for unhashable arguments).
     """
-    l = [id(cls)]
-    for arg in args:
-        l.append(id(arg))
-    l.extend((k, id(v)) for k, v in kwargs.items())
-    return tuple(sorted(l))
+    key = (cls, tuple(args), frozenset(kwargs.items()))
+    try:
+        hash(key)
+    except TypeError:
+        l = [id(cls)]
+        for arg in args:
+            l.append(id(arg))
+        l.extend((k, id(v)) for k, v in kwargs.items())
+        return tuple(sorted(l))
+    return key
 
 
 # used as a metaclass for classes that should be memoized
@@ -160,13 +223,85 @@ def get_class_instance_key(cls, args, kwargs):
 Cached = mementos.memento_factory('Cached', get_class_instance_key)
 
 
-def memoize(fun):
+CacheInfo = collections.namedtuple(
+    'CacheInfo', ['hits', 'misses', 'maxsize', 'currsize']
+)
+
+
+def _copy_result(v):
+    if isinstance(v, pq):
+        return v.clone()
+    else:
+        return copy.deepcopy(v)
+
+
+def _share_result(v):
+    # a shallow copy shares the underlying data but lets the caller add, drop
+    # or rename columns without affecting the memoized frame
+    if isinstance(v, (pd.DataFrame, pd.Series)):
+        return v.copy(deep=False)
+    else:
+        return v
+
+
+def _persist_key(fun, args, kwargs):
+    """Returns the key of a function call's result in the ResultCache, or None
+    if an argument has no stable representation."""
+    parts = ['{}.{}'.format(fun.__module__,
+                            getattr(fun, '__qualname__', fun.__name__))]
+    parts.extend(repr(arg) for arg in args)
+    parts.extend('{}={!r}'.format(k, v) for k, v in sorted(kwargs.items()))
+    if any(' at 0x' in part for part in parts):
+        return None
+    parts.append('v{}'.format(sportsref.cache.PARSE_VERSION))
+    return '\n'.join(parts)
+
+
+def _deps_are_current(deps):
+    """Returns True if every page a persisted result was parsed from is still
+    in the page cache, unchanged and not stale."""
+    page_cache = sportsref.cache.get_page_cache()
+    for url, content_hash in deps.items():
+        entry = page_cache.lookup(url)
+        if (not entry or entry['hash'] != content_hash or
+                not _is_fresh(url, entry, sport_id_for_url(url))):
+            return False
+    return True
+
+
+def memoize(fun=None, maxsize=None, frozen=False, persist=False):
     """A decorator for memoizing functions.
 
     Only works on functions that take simple arguments - arguments that take
     list-like or dict-like arguments will not be memoized, and this function
     will raise a TypeError.
+
+    Can be used bare (``@memoize``) or with arguments
+    (``@memoize(maxsize=128, frozen=True)``). The decorated function gains
+    ``cache_info()`` and ``cache_clear()`` methods, like
+    :func:`functools.lru_cache`.
+
+    :maxsize: maximum number of results to keep; the least recently used
+        result is discarded when it is exceeded. Defaults to the
+        'memoize_maxsize' option; None means unbounded.
+    :frozen: if True, hits return the memoized object itself (DataFrames and
+        Series are shallow copies) instead of a deep copy. Callers must treat
+        these results as read-only, so it isn't suitable for PyQuery
+        documents, which parsing helpers like `flatten_links` modify.
+    :persist: if True, results are also pickled to disk (see
+        :class:`sportsref.cache.ResultCache`) so that other processes can skip
+        parsing. A stored result is used only while every page it was parsed
+        from is unchanged and fresh in the page cache, and only for the
+        current :data:`sportsref.cache.PARSE_VERSION`. Arguments (including
+        ``self``) must have a repr that identifies them. Also requires the
+        'cache' and 'persist' options.
     """
+    if fun is None:
+        return functools.partial(memoize, maxsize=maxsize, frozen=frozen,
+                                 persist=persist)
+
+    _copy = _share_result if frozen else _copy_result
+
     @funcutils.wraps(fun)
     def wrapper(*args, **kwargs):
 
@@ -178,28 +313,172 @@ def memoize(fun):
         hash_kwargs = frozenset(sorted(kwargs.items()))
         key = (hash_args, hash_kwargs)
 
-        def _copy(v):
-            if isinstance(v, pq):
-                return v.clone()
-            else:
-                return copy.deepcopy(v)
-
         try:
-            ret = _copy(cache[key])
-            return ret
-        except KeyError:
-            cache[key] = fun(*args, **kwargs)
-            ret = _copy(cache[key])
-            return ret
+            hit, ret = _lookup(key)
+            if not hit:
+                with lock:
+                    key_lock = key_locks.setdefault(key, threading.RLock())
         except TypeError:
             print('memoization type error in function {} for arguments {}'
                   .format(fun.__name__, key))
             raise
-
-    cache = {}
+        if hit:
+            return _copy(ret)
+
+        # only one thread computes a given key; the others wait for it here
+        # and then find the result in the cache
+        with key_lock:
+            hit, ret = _lookup(key)
+            if hit:
+                return _copy(ret)
+            try:
+                ret, deps = _compute(args, kwargs)
+            except BaseException:
+                with lock:
+                    key_locks.pop(key, None)
+                raise
+            # store the result and drop the key lock together, so a thread
+            # arriving in between can't miss both and compute the key again
+            with lock:
+                key_locks.pop(key, None)
+                stats['misses'] += 1
+                cache[key] = ret, deps
+                limit = (maxsize if maxsize is not None
+                         else sportsref.get_option('memoize_maxsize'))
+                while limit is not None and len(cache) > limit:
+                    cache.popitem(last=False)
+        return _copy(ret)
+
+    def _lookup(key):
+        with lock:
+            if key not in cache:
+                return False, None
+            cache.move_to_end(key)
+            stats['hits'] += 1
+            ret, deps = cache[key]
+        # the caller depends on the pages this result was parsed from
+        _record_dependencies(deps)
+        return True, ret
+
+    def _compute(args, kwargs):
+        persist_key = None
+        if (persist and sportsref.get_option('persist') and
+                sportsref.get_option('cache')):
+            persist_key = _persist_key(fun, args, kwargs)
+        if persist_key is not None:
+            stored = sportsref.cache.get_result_cache().get(persist_key)
+            if stored is not None and _deps_are_current(stored[0]):
+                deps, ret = stored
+                _record_dependencies(deps)
+                return ret, deps
+        with _recording_dependencies() as deps:
+            ret = fun(*args, **kwargs)
+        # only results known to come from cached pages can be invalidated
+        if persist_key is not None and deps:
+            sportsref.cache.get_result_cache().put(persist_key, deps, ret)
+        return ret, deps
+
+    def cache_info():
+        with lock:
+            limit = (maxsize if maxsize is not None
+                     else sportsref.get_option('memoize_maxsize'))
+            return CacheInfo(stats['hits'], stats['misses'], limit,
+                             len(cache))
+
+    def cache_clear():
+        with lock:
+            cache.clear()
+            stats['hits'] = stats['misses'] = 0
+
+    def cache_items(first_arg):
+        """Returns (key, result, deps) for the memoized calls whose first
+        argument is `first_arg` (e.g. an instance, for methods)."""
+        with lock:
+            return [(key, ret, deps) for key, (ret, deps) in cache.items()
+                    if key[0] and key[0][0] is first_arg]
+
+    def cache_update(items):
+        """Adds (key, result, deps) items as returned by cache_items."""
+        with lock:
+            for key, ret, deps in items:
+                cache[key] = ret, deps
+            limit = (maxsize if maxsize is not None
+                     else sportsref.get_option('memoize_maxsize'))
+            while limit is not None and len(cache) > limit:
+                cache.popitem(last=False)
+
+    cache = collections.OrderedDict()
+    key_locks = {}
+    lock = threading.Lock()
+    stats = {'hits': 0, 'misses': 0}
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
+    wrapper.cache_items = cache_items
+    wrapper.cache_update = cache_update
     return wrapper
 
 
+def _memoized_methods(cls):
+    """Yields (name, method) for the memoized methods of a class."""
+    seen = set()
+    for klass in cls.__mro__:
+        for name, attr in vars(klass).items():
+            if name not in seen and hasattr(attr, 'cache_items'):
+                seen.add(name)
+                yield name, attr
+
+
+# ids of the objects being pickled by reduce_instance in this thread, so that
+# an object referenced by its own results is pickled by ID only
+_reducing = threading.local()
+
+
+def reduce_instance(obj, *args):
+    """Implements ``__reduce__`` for the model classes (BoxScore, Player,
+    etc.), which are pickled as just their class and constructor arguments.
+
+    If the 'pickle_results' option is True, the results of the instance's
+    memoized methods are pickled along with it (compressed; results that
+    can't be pickled, like PyQuery documents, are left out) and put back in
+    the memoized methods' caches when it is unpickled, so e.g. a worker
+    process doesn't have to parse them again.
+
+    :obj: the instance being pickled.
+    :args: the arguments to pass to the class to recreate it.
+    :returns: a value for ``__reduce__`` to return.
+    """
+    cls = type(obj)
+    in_progress = _reducing.__dict__.setdefault('ids', set())
+    if not sportsref.get_option('pickle_results') or id(obj) in in_progress:
+        return cls, args
+
+    in_progress.add(id(obj))
+    try:
+        results = []
+        for name, method in _memoized_methods(cls):
+            for (m_args, m_kwargs), ret, deps in method.cache_items(obj):
+                try:
+                    results.append(pickle.dumps(
+                        (name, m_args[1:], m_kwargs, ret, deps),
+                        pickle.HIGHEST_PROTOCOL
+                    ))
+                except Exception:
+                    continue
+    finally:
+        in_progress.discard(id(obj))
+    payload = zlib.compress(pickle.dumps(results, pickle.HIGHEST_PROTOCOL))
+    return _rebuild_instance, (cls, args, payload)
+
+
+def _rebuild_instance(cls, args, payload):
+    obj = cls(*args)
+    methods = dict(_memoized_methods(cls))
+    for data in pickle.loads(zlib.decompress(payload)):
+        name, m_args, m_kwargs, ret, deps = pickle.loads(data)
+        methods[name].cache_update([(((obj,) + m_args, m_kwargs), ret, deps)])
+    return obj
+
+
 def kind_rpb(include_type=False):
     def decorator(fun):
         """Supports functions that return a DataFrame and have a `kind` keyword
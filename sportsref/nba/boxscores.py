@@ -29,6 +29,9 @@ class BoxScore(
     def __repr__(self):
         return 'BoxScore({})'.format(self.boxscore_id)
 
+    def __reduce__(self):
+        return sportsref.decorators.reduce_instance(self, self.boxscore_id)
+
     @sportsref.decorators.memoize
     def get_main_doc(self):
         url = ('{}/boxscores/{}.html'
@@ -164,17 +167,17 @@ class BoxScore(
 
         return pd.concat(dfs)
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(frozen=True, persist=True)
     def basic_stats(self):
         """Returns a DataFrame of basic player stats from the game."""
         return self._get_player_stats('box_{}_basic')
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(persist=True)
     def advanced_stats(self):
         """Returns a DataFrame of advanced player stats from the game."""
         return self._get_player_stats('box_{}_advanced')
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(persist=True)
     def pbp(self, dense_lineups=False, sparse_lineups=False):
         """Returns a dataframe of the play-by-play data from the game.
 
@@ -192,76 +195,92 @@ class BoxScore(
                 'Error fetching PBP subpage for boxscore {}'
                 .format(self.boxscore_id)
             )
-        table = doc('table#pbp')
+        # in one pass over the table's data rows and quarter boundary rows,
+        # collect each play's quarter, clock string and cells
         trs = [
-            tr for tr in table('tr').items()
-            if (not tr.attr['class'] or  # regular data rows
-                tr.attr['id'] and tr.attr['id'].startswith('q'))  # qtr bounds
+            tr for table in doc('table#pbp')
+            for tr in table.xpath(
+                './/tr[not(@class) or @class="" or starts-with(@id, "q")]'
+            )
         ]
-        rows = [tr.children('td') for tr in trs]
-        n_rows = len(trs)
-        data = []
+        quarters, clocks, rows = [], [], []
         cur_qtr = 0
-        bsid = self.boxscore_id
-
-        for i in range(n_rows):
-            tr = trs[i]
-            row = rows[i]
-            p = {}
-
+        for tr in trs:
             # increment cur_qtr when we hit a new quarter
-            if tr.attr['id'] and tr.attr['id'].startswith('q'):
-                assert int(tr.attr['id'][1:]) == cur_qtr + 1
+            tr_id = tr.get('id')
+            if tr_id and tr_id.startswith('q'):
+                assert int(tr_id[1:]) == cur_qtr + 1
                 cur_qtr += 1
                 continue
+            row = [td for td in tr if td.tag == 'td']
+            quarters.append(cur_qtr)
+            clocks.append(sportsref.utils.element_text(row[0]) if row else '')
+            rows.append(row)
+
+        # convert clock strings to seconds elapsed in the game
+        clock_parts = pd.Series(clocks, dtype=object).str.extract(
+            r'^(\d+):(\d+)\.(\d+)'
+        )
+        if clock_parts.isnull().any().any():
+            bad_clock = clocks[clock_parts.isnull().any(axis=1).idxmax()]
+            raise ValueError('Unparseable clock time {} in boxscore {}'
+                             .format(bad_clock, self.boxscore_id))
+        mins, secs, tenths = clock_parts.values.astype(np.int64).T
+        quarters = np.array(quarters, dtype=np.int64)
+        endQ = (12 * 60 * np.minimum(quarters, 4) +
+                5 * 60 * np.maximum(quarters - 4, 0))
+        secs_elapsed = endQ - (60 * mins + secs + 0.1 * tenths)
+
+        data = []
+        context = sportsref.nba.pbp.get_play_context(self.boxscore_id)
+        for i, row in enumerate(rows):
+            p = {}
 
             # add time of play to entry
-            t_str = row.eq(0).text()
-            t_regex = r'(\d+):(\d+)\.(\d+)'
-            mins, secs, tenths = map(int, re.match(t_regex, t_str).groups())
-            endQ = (12 * 60 * min(cur_qtr, 4) +
-                    5 * 60 * (cur_qtr - 4 if cur_qtr > 4 else 0))
-            secsElapsed = endQ - (60 * mins + secs + 0.1 * tenths)
-            p['secs_elapsed'] = secsElapsed
+            t_str = clocks[i]
+            p['secs_elapsed'] = secs_elapsed[i]
             p['clock_time'] = t_str
-            p['quarter'] = cur_qtr
+            p['quarter'] = quarters[i]
 
             # handle single play description
             # ex: beginning/end of quarter, jump ball
-            if row.length == 2:
-                desc = row.eq(1)
+            if len(row) == 2:
+                desc = row[1]
+                desc_text = sportsref.utils.element_text(desc).lower()
                 # handle jump balls
-                if desc.text().lower().startswith('jump ball: '):
+                if desc_text.startswith('jump ball: '):
                     p['is_jump_ball'] = True
-                    jb_str = sportsref.utils.flatten_links(desc)
-                    p.update(
-                        sportsref.nba.pbp.parse_play(bsid, jb_str, None)
-                    )
+                    jb_str = sportsref.utils.flatten_element(desc)
+                    p.update(sportsref.nba.pbp.parse_play_in_context(
+                        context, jb_str, None
+                    ))
                 # ignore rows marking beginning/end of quarters
                 elif (
-                    desc.text().lower().startswith('start of ') or
-                    desc.text().lower().startswith('end of ')
+                    desc_text.startswith('start of ') or
+                    desc_text.startswith('end of ')
                 ):
                     continue
                 # if another case, log and continue
                 else:
-                    if not desc.text().lower().startswith('end of '):
+                    if not desc_text.startswith('end of '):
                         print(
                             '{}, Q{}, {} other case: {}'
-                            .format(self.boxscore_id, cur_qtr,
-                                    t_str, desc.text())
+                            .format(self.boxscore_id, quarters[i],
+                                    t_str, sportsref.utils.element_text(desc))
                         )
                     continue
 
             # handle team play description
             # ex: shot, turnover, rebound, foul, sub, etc.
-            elif row.length == 6:
-                aw_desc, hm_desc = row.eq(1), row.eq(5)
-                is_hm_play = bool(hm_desc.text())
+            elif len(row) == 6:
+                aw_desc, hm_desc = row[1], row[5]
+                is_hm_play = bool(sportsref.utils.element_text(hm_desc))
                 desc = hm_desc if is_hm_play else aw_desc
-                desc = sportsref.utils.flatten_links(desc)
+                desc = sportsref.utils.flatten_element(desc)
                 # parse the play
-                new_p = sportsref.nba.pbp.parse_play(bsid, desc, is_hm_play)
+                new_p = sportsref.nba.pbp.parse_play_in_context(
+                    context, desc, is_hm_play
+                )
                 if not new_p:
                     continue
                 elif isinstance(new_p, list):
@@ -284,7 +303,7 @@ class BoxScore(
             # otherwise, I don't know what this was
             else:
                 raise Exception(("don't know how to handle row of length {}"
-                                 .format(row.length)))
+                                 .format(len(row))))
 
             data.append(p)
 
@@ -350,12 +369,19 @@ class BoxScore(
                       'fta_num', 'is_viol', 'is_to', 'is_jump_ball', 'is_sub']
                      if col in df.columns]
         asc_true = ['fta_num']
-        ascend = [(col in asc_true) for col in sort_cols]
-        for label, group in df.groupby([df.secs_elapsed, poss_id_reb]):
-            if len(group) > 1:
-                df.loc[group.index, :] = group.sort_values(
-                    sort_cols, ascending=ascend, kind='mergesort'
-                ).values
+        # encode sort_cols' precedence as one integer per play, so that a
+        # single stable sort orders the plays within each (secs_elapsed,
+        # poss_id_reb) group; like sort_values, NaNs go last in each column
+        priority = np.zeros(len(df), dtype=np.int64)
+        for col in sort_cols:
+            codes, uniques = pd.factorize(df[col], sort=True)
+            n = len(uniques)
+            if col not in asc_true:
+                codes = np.where(codes < 0, codes, n - 1 - codes)
+            priority = priority * (n + 1) + np.where(codes < 0, n, codes)
+        order = np.lexsort((priority, poss_id_reb.values,
+                            df.secs_elapsed.values))
+        df = df.iloc[order].reset_index(drop=True)
 
         # 2nd pass: get rid of 'rebounds' after FTM, non-final FTA, etc.
         df = _clean_rebs(df)
@@ -384,42 +410,7 @@ class BoxScore(
         poss_id_reb = np.cumsum(new_poss | df.is_reb)
 
         # get rid of redundant subs
-        for (se, tm, pnum), group in df[df.is_sub].groupby(
-            [df.secs_elapsed, df.sub_team, poss_id_reb]
-        ):
-            if len(group) > 1:
-                sub_in = set()
-                sub_out = set()
-                # first, figure out who's in and who's out after subs
-                for i, row in group.iterrows():
-                    if row['sub_in'] in sub_out:
-                        sub_out.remove(row['sub_in'])
-                    else:
-                        sub_in.add(row['sub_in'])
-                    if row['sub_out'] in sub_in:
-                        sub_in.remove(row['sub_out'])
-                    else:
-                        sub_out.add(row['sub_out'])
-                assert len(sub_in) == len(sub_out)
-                # second, add those subs
-                n_subs = len(sub_in)
-                for idx, p_in, p_out in zip(
-                    group.index[:n_subs], sub_in, sub_out
-                ):
-                    assert df.loc[idx, 'is_sub']
-                    df.loc[idx, 'sub_in'] = p_in
-                    df.loc[idx, 'sub_out'] = p_out
-                    df.loc[idx, 'sub_team'] = tm
-                    df.loc[idx, 'detail'] = (
-                        '{} enters the game for {}'.format(p_in, p_out)
-                    )
-                # third, if applicable, remove old sub entries when there are
-                # redundant subs
-                n_extra = len(group) - len(sub_in)
-                if n_extra:
-                    extra_idxs = group.index[-n_extra:]
-                    df.drop(extra_idxs, axis=0, inplace=True)
-
+        df = sportsref.nba.pbp.collapse_redundant_subs(df, poss_id_reb)
         df.reset_index(drop=True, inplace=True)
 
         # add column for pts and score
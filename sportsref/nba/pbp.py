@@ -1,13 +1,13 @@
 from __future__ import print_function
-from builtins import map
 from past.builtins import basestring
-from builtins import enumerate, int, list, range, zip
+from builtins import enumerate, int, range, zip
 
 import operator
 import re
 
 import numpy as np
 import pandas as pd
+import scipy.sparse
 
 import sportsref
 
@@ -17,18 +17,246 @@ HM_LINEUP_COLS = ['hm_player{}'.format(i) for i in range(1, 6)]
 AW_LINEUP_COLS = ['aw_player{}'.format(i) for i in range(1, 6)]
 ALL_LINEUP_COLS = AW_LINEUP_COLS + HM_LINEUP_COLS
 
+# columns of a parsed play that can name a player who is on the court
+PLAYER_KEYS = [
+    'assister', 'away_jumper', 'blocker', 'drew_foul', 'fouler',
+    'ft_shooter', 'gains_poss', 'home_jumper', 'rebounder', 'shooter',
+    'stealer', 'sub_in', 'sub_out', 'to_by'
+]
+
 
 def sparse_lineup_cols(df):
     regex = '{}_in'.format(PLAYER_RE)
     return [c for c in df.columns if re.match(regex, c)]
 
 
+def _compile_play_regexes():
+    """Compiles the regexes used by :func:`parse_play`.
+
+    :returns: list of (play kind, compiled regex) pairs, in the order in
+        which they are tried.
+    """
+    # field goal attempts
+    shotRE = (r'(?P<shooter>{0}) (?P<is_fgm>makes|misses) '
+              '(?P<is_three>2|3)\-pt shot').format(PLAYER_RE)
+    distRE = r' (?:from (?P<shot_dist>\d+) ft|at rim)'
+    assistRE = r' \(assist by (?P<assister>{0})\)'.format(PLAYER_RE)
+    blockRE = r' \(block by (?P<blocker>{0})\)'.format(PLAYER_RE)
+    shotRE = r'{0}{1}(?:{2}|{3})?'.format(shotRE, distRE, assistRE, blockRE)
+
+    # jump balls
+    jumpRE = ((r'Jump ball: (?P<away_jumper>{0}) vs\. (?P<home_jumper>{0})'
+               r'(?: \((?P<gains_poss>{0}) gains possession\))?')
+              .format(PLAYER_RE))
+
+    # rebounds
+    rebRE = (r'(?P<is_oreb>Offensive|Defensive) rebound'
+             r' by (?P<rebounder>{0}|Team)').format(PLAYER_RE)
+
+    # free throws
+    ftRE = (r'(?P<ft_shooter>{}) (?P<is_ftm>makes|misses) '
+            r'(?P<is_tech_fta>technical )?(?P<is_flag_fta>flagrant )?'
+            r'(?P<is_clearpath_fta>clear path )?free throw'
+            r'(?: (?P<fta_num>\d+) of (?P<tot_fta>\d+))?').format(PLAYER_RE)
+
+    # substitutions
+    subRE = (r'(?P<sub_in>{0}) enters the game for '
+             r'(?P<sub_out>{0})').format(PLAYER_RE)
+
+    # turnovers
+    toReasons = (r'(?P<to_type>[^;]+)(?:; steal by '
+                 r'(?P<stealer>{0}))?').format(PLAYER_RE)
+    toRE = (r'Turnover by (?P<to_by>{}|Team) '
+            r'\((?:{})\)').format(PLAYER_RE, toReasons)
+
+    # shooting fouls
+    shotFoulRE = (r'Shooting(?P<is_block_foul> block)? foul by (?P<fouler>{0})'
+                  r'(?: \(drawn by (?P<drew_foul>{0})\))?').format(PLAYER_RE)
+
+    # offensive fouls
+    offFoulRE = (r'Offensive(?P<is_charge> charge)? foul '
+                 r'by (?P<to_by>{0})'
+                 r'(?: \(drawn by (?P<drew_foul>{0})\))?').format(PLAYER_RE)
+
+    # personal fouls
+    foulRE = (r'Personal (?P<is_take_foul>take )?(?P<is_block_foul>block )?'
+              r'foul by (?P<fouler>{0})(?: \(drawn by '
+              r'(?P<drew_foul>{0})\))?').format(PLAYER_RE)
+
+    # loose ball fouls
+    looseBallRE = (r'Loose ball foul by (?P<fouler>{0})'
+                   r'(?: \(drawn by (?P<drew_foul>{0})\))?').format(PLAYER_RE)
+
+    # away from play fouls
+    awayFromBallRE = ((r'Away from play foul by (?P<fouler>{0})'
+                       r'(?: \(drawn by (?P<drew_foul>{0})\))?')
+                      .format(PLAYER_RE))
+
+    # inbound fouls
+    inboundRE = (r'Inbound foul by (?P<fouler>{0})'
+                 r'(?: \(drawn by (?P<drew_foul>{0})\))?').format(PLAYER_RE)
+
+    # flagrant fouls
+    flagrantRE = (r'Flagrant foul type (?P<flag_type>1|2) by (?P<fouler>{0})'
+                  r'(?: \(drawn by (?P<drew_foul>{0})\))?').format(PLAYER_RE)
+
+    # clear path fouls
+    clearPathRE = (r'Clear path foul by (?P<fouler>{0})'
+                   r'(?: \(drawn by (?P<drew_foul>{0})\))?').format(PLAYER_RE)
+
+    # timeouts
+    timeoutRE = r'(?P<timeout_team>.*?) (?:full )?timeout'
+
+    # technical fouls
+    techRE = (r'(?P<is_hanging>Hanging )?'
+              r'(?P<is_taunting>Taunting )?'
+              r'(?P<is_ill_def>Ill def )?'
+              r'(?P<is_delay>Delay )?'
+              r'(?P<is_unsport>Non unsport )?'
+              r'tech(?:nical)? foul by '
+              r'(?P<tech_fouler>{0}|Team)').format(PLAYER_RE)
+
+    # ejections
+    ejectRE = r'(?P<ejectee>{0}|Team) ejected from game'.format(PLAYER_RE)
+
+    # defensive 3 seconds techs
+    def3TechRE = (r'(?:Def 3 sec tech foul|Defensive three seconds)'
+                  r' by (?P<tech_fouler>{})').format(PLAYER_RE)
+
+    # violations
+    violRE = (r'Violation by (?P<violator>{0}|Team) '
+              r'\((?P<viol_type>.*)\)').format(PLAYER_RE)
+
+    return [
+        ('shot', re.compile(shotRE, re.I)),
+        ('jump_ball', re.compile(jumpRE, re.I)),
+        ('reb', re.compile(rebRE, re.I)),
+        ('ft', re.compile(ftRE, re.I)),
+        ('sub', re.compile(subRE, re.I)),
+        ('to', re.compile(toRE, re.I)),
+        ('shot_foul', re.compile(shotFoulRE, re.I)),
+        ('off_foul', re.compile(offFoulRE, re.I)),
+        ('pf', re.compile(foulRE, re.I)),
+        ('loose_ball_foul', re.compile(looseBallRE, re.I)),
+        ('away_from_play_foul', re.compile(awayFromBallRE, re.I)),
+        ('inbound_foul', re.compile(inboundRE, re.I)),
+        ('flagrant', re.compile(flagrantRE, re.I)),
+        ('clear_path_foul', re.compile(clearPathRE, re.I)),
+        ('timeout', re.compile(timeoutRE, re.I)),
+        ('tech_foul', re.compile(techRE, re.I)),
+        ('ejection', re.compile(ejectRE, re.I)),
+        ('def_three_secs', re.compile(def3TechRE, re.I)),
+        ('viol', re.compile(violRE, re.I)),
+    ]
+
+
+# compiled once at import, in the order parse_play tries them
+PLAY_REGEXES = _compile_play_regexes()
+
+# play kinds that can match a play description, indexed by its first or
+# second (lowercase) word; the second word follows the player in plays like
+# "<player> makes 2-pt shot" or "<player> enters the game for <player>"
+FIRST_WORD_KINDS = {
+    'jump': ('jump_ball',),
+    'offensive': ('reb', 'off_foul'),
+    'defensive': ('reb', 'def_three_secs'),
+    'turnover': ('to',),
+    'shooting': ('shot_foul',),
+    'personal': ('pf',),
+    'loose': ('loose_ball_foul',),
+    'away': ('away_from_play_foul',),
+    'inbound': ('inbound_foul',),
+    'flagrant': ('flagrant',),
+    'clear': ('clear_path_foul',),
+    'hanging': ('tech_foul',),
+    'taunting': ('tech_foul',),
+    'ill': ('tech_foul',),
+    'delay': ('tech_foul',),
+    'non': ('tech_foul',),
+    'tech': ('tech_foul',),
+    'technical': ('tech_foul',),
+    'def': ('def_three_secs',),
+    'violation': ('viol',),
+}
+SECOND_WORD_KINDS = {
+    'makes': ('shot', 'ft'),
+    'misses': ('shot', 'ft'),
+    'enters': ('sub',),
+    'ejected': ('ejection',),
+}
+
+
+def match_play(details):
+    """Finds the kind of play a play-by-play string describes, only trying
+    the regexes that the string's leading words allow.
+
+    :param details: detail string for the play
+    :returns: tuple of the play kind (e.g. 'shot' or 'reb') and the regex
+        match object, or (None, None) if no regex matches.
+    """
+    lowered = details.lower()
+    words = lowered.split(' ', 2)
+    kinds = set(FIRST_WORD_KINDS.get(words[0], ()))
+    if len(words) > 1:
+        kinds.update(SECOND_WORD_KINDS.get(words[1], ()))
+    if ' timeout' in lowered:
+        kinds.add('timeout')
+    for kind, regex in PLAY_REGEXES:
+        if kind in kinds:
+            m = regex.match(details)
+            if m:
+                return kind, m
+    return None, None
+
+
+class PlayContext(object):
+
+    """Information about a game that is needed to parse its plays: the home
+    and away teams, their rosters, and the season's team names. Built once
+    per game, rather than once per play."""
+
+    def __init__(self, boxscore_id):
+        bs = sportsref.nba.BoxScore(boxscore_id)
+        self.boxscore_id = boxscore_id
+        self.home = bs.home()
+        self.away = bs.away()
+        self.season = bs.season()
+        stats = bs.basic_stats()
+        self.hm_roster = set(stats.query('is_home == True').player_id.values)
+        self.aw_roster = set(stats.query('is_home == False').player_id.values)
+        self._team_names_to_ids = None
+
+    def __repr__(self):
+        return 'PlayContext({})'.format(self.boxscore_id)
+
+    def team_names_to_ids(self):
+        """Mapping from full team names to 3-letter team IDs for the game's
+        season; only fetched when first needed.
+        :returns: Dictionary with team names as keys and team IDs as values.
+        """
+        if self._team_names_to_ids is None:
+            season = sportsref.nba.Season(self.season)
+            self._team_names_to_ids = season.team_names_to_ids()
+        return self._team_names_to_ids
+
+
+@sportsref.decorators.memoize(frozen=True)
+def get_play_context(boxscore_id):
+    """Returns the PlayContext for a game.
+
+    :param boxscore_id: the boxscore ID of the game
+    :returns: PlayContext
+    """
+    return PlayContext(boxscore_id)
+
+
 def parse_play(boxscore_id, details, is_hm):
     """Parse play details from a play-by-play string describing a play.
 
     Assuming valid input, this function returns structured data in a dictionary
     describing the play. If the play detail string was invalid, this function
-    returns None.
+    returns None. When parsing many plays from a game, prefer
+    :func:`parse_play_in_context`.
 
     :param boxscore_id: the boxscore ID of the play
     :param details: detail string for the play
@@ -40,10 +268,25 @@ def parse_play(boxscore_id, details, is_hm):
     if not details or not isinstance(details, basestring):
         return None
 
-    bs = sportsref.nba.BoxScore(boxscore_id)
-    aw, hm = bs.away(), bs.home()
-    season = sportsref.nba.Season(bs.season())
-    hm_roster = set(bs.basic_stats().query('is_home == True').player_id.values)
+    return parse_play_in_context(get_play_context(boxscore_id), details, is_hm)
+
+
+def parse_play_in_context(context, details, is_hm):
+    """Parse play details from a play-by-play string describing a play, using
+    game information from a :class:`PlayContext`.
+
+    :param context: the PlayContext of the play's game
+    :param details: detail string for the play
+    :param is_hm: bool indicating whether the offense is at home
+    :param returns: dictionary of play attributes or None if invalid
+    :rtype: dictionary or None
+    """
+    # if input isn't a string, return None
+    if not details or not isinstance(details, basestring):
+        return None
+
+    aw, hm = context.away, context.home
+    hm_roster = context.hm_roster
 
     p = {}
     p['detail'] = details
@@ -51,15 +294,10 @@ def parse_play(boxscore_id, details, is_hm):
     p['away'] = aw
     p['is_home_play'] = is_hm
 
+    kind, m = match_play(details)
+
     # parsing field goal attempts
-    shotRE = (r'(?P<shooter>{0}) (?P<is_fgm>makes|misses) '
-              '(?P<is_three>2|3)\-pt shot').format(PLAYER_RE)
-    distRE = r' (?:from (?P<shot_dist>\d+) ft|at rim)'
-    assistRE = r' \(assist by (?P<assister>{0})\)'.format(PLAYER_RE)
-    blockRE = r' \(block by (?P<blocker>{0})\)'.format(PLAYER_RE)
-    shotRE = r'{0}{1}(?:{2}|{3})?'.format(shotRE, distRE, assistRE, blockRE)
-    m = re.match(shotRE, details, re.IGNORECASE)
-    if m:
+    if kind == 'shot':
         p['is_fga'] = True
         p.update(m.groupdict())
         p['shot_dist'] = p['shot_dist'] if p['shot_dist'] is not None else 0
@@ -74,20 +312,13 @@ def parse_play(boxscore_id, details, is_hm):
         return p
 
     # parsing jump balls
-    jumpRE = ((r'Jump ball: (?P<away_jumper>{0}) vs\. (?P<home_jumper>{0})'
-               r'(?: \((?P<gains_poss>{0}) gains possession\))?')
-              .format(PLAYER_RE))
-    m = re.match(jumpRE, details, re.IGNORECASE)
-    if m:
+    if kind == 'jump_ball':
         p['is_jump_ball'] = True
         p.update(m.groupdict())
         return p
 
     # parsing rebounds
-    rebRE = (r'(?P<is_oreb>Offensive|Defensive) rebound'
-             r' by (?P<rebounder>{0}|Team)').format(PLAYER_RE)
-    m = re.match(rebRE, details, re.I)
-    if m:
+    if kind == 'reb':
         p['is_reb'] = True
         p.update(m.groupdict())
         p['is_oreb'] = p['is_oreb'].lower() == 'offensive'
@@ -102,12 +333,7 @@ def parse_play(boxscore_id, details, is_hm):
         return p
 
     # parsing free throws
-    ftRE = (r'(?P<ft_shooter>{}) (?P<is_ftm>makes|misses) '
-            r'(?P<is_tech_fta>technical )?(?P<is_flag_fta>flagrant )?'
-            r'(?P<is_clearpath_fta>clear path )?free throw'
-            r'(?: (?P<fta_num>\d+) of (?P<tot_fta>\d+))?').format(PLAYER_RE)
-    m = re.match(ftRE, details, re.I)
-    if m:
+    if kind == 'ft':
         p['is_fta'] = True
         p.update(m.groupdict())
         p['is_ftm'] = p['is_ftm'] == 'makes'
@@ -127,10 +353,7 @@ def parse_play(boxscore_id, details, is_hm):
         return p
 
     # parsing substitutions
-    subRE = (r'(?P<sub_in>{0}) enters the game for '
-             r'(?P<sub_out>{0})').format(PLAYER_RE)
-    m = re.match(subRE, details, re.I)
-    if m:
+    if kind == 'sub':
         p['is_sub'] = True
         p.update(m.groupdict())
         sub_home = p['sub_in'] in hm_roster or p['sub_out'] in hm_roster
@@ -138,12 +361,7 @@ def parse_play(boxscore_id, details, is_hm):
         return p
 
     # parsing turnovers
-    toReasons = (r'(?P<to_type>[^;]+)(?:; steal by '
-                 r'(?P<stealer>{0}))?').format(PLAYER_RE)
-    toRE = (r'Turnover by (?P<to_by>{}|Team) '
-            r'\((?:{})\)').format(PLAYER_RE, toReasons)
-    m = re.match(toRE, details, re.I)
-    if m:
+    if kind == 'to':
         p['is_to'] = True
         p.update(m.groupdict())
         p['to_type'] = p['to_type'].lower()
@@ -169,10 +387,7 @@ def parse_play(boxscore_id, details, is_hm):
         return p
 
     # parsing shooting fouls
-    shotFoulRE = (r'Shooting(?P<is_block_foul> block)? foul by (?P<fouler>{0})'
-                  r'(?: \(drawn by (?P<drew_foul>{0})\))?').format(PLAYER_RE)
-    m = re.match(shotFoulRE, details, re.I)
-    if m:
+    if kind == 'shot_foul':
         p['is_pf'] = True
         p['is_shot_foul'] = True
         p.update(m.groupdict())
@@ -184,11 +399,7 @@ def parse_play(boxscore_id, details, is_hm):
         return p
 
     # parsing offensive fouls
-    offFoulRE = (r'Offensive(?P<is_charge> charge)? foul '
-                 r'by (?P<to_by>{0})'
-                 r'(?: \(drawn by (?P<drew_foul>{0})\))?').format(PLAYER_RE)
-    m = re.match(offFoulRE, details, re.I)
-    if m:
+    if kind == 'off_foul':
         p['is_pf'] = True
         p['is_off_foul'] = True
         p['is_to'] = True
@@ -203,11 +414,7 @@ def parse_play(boxscore_id, details, is_hm):
         return p
 
     # parsing personal fouls
-    foulRE = (r'Personal (?P<is_take_foul>take )?(?P<is_block_foul>block )?'
-              r'foul by (?P<fouler>{0})(?: \(drawn by '
-              r'(?P<drew_foul>{0})\))?').format(PLAYER_RE)
-    m = re.match(foulRE, details, re.I)
-    if m:
+    if kind == 'pf':
         p['is_pf'] = True
         p.update(m.groupdict())
         p['is_take_foul'] = bool(p['is_take_foul'])
@@ -228,10 +435,7 @@ def parse_play(boxscore_id, details, is_hm):
     #     p['off_team'] =
 
     # parsing loose ball fouls
-    looseBallRE = (r'Loose ball foul by (?P<fouler>{0})'
-                   r'(?: \(drawn by (?P<drew_foul>{0})\))?').format(PLAYER_RE)
-    m = re.match(looseBallRE, details, re.I)
-    if m:
+    if kind == 'loose_ball_foul':
         p['is_pf'] = True
         p['is_loose_ball_foul'] = True
         p.update(m.groupdict())
@@ -243,11 +447,7 @@ def parse_play(boxscore_id, details, is_hm):
     # TODO
 
     # parsing away from play fouls
-    awayFromBallRE = ((r'Away from play foul by (?P<fouler>{0})'
-                       r'(?: \(drawn by (?P<drew_foul>{0})\))?')
-                      .format(PLAYER_RE))
-    m = re.match(awayFromBallRE, details, re.I)
-    if m:
+    if kind == 'away_from_play_foul':
         p['is_pf'] = True
         p['is_away_from_play_foul'] = True
         p.update(m.groupdict())
@@ -257,10 +457,7 @@ def parse_play(boxscore_id, details, is_hm):
         return p
 
     # parsing inbound fouls
-    inboundRE = (r'Inbound foul by (?P<fouler>{0})'
-                 r'(?: \(drawn by (?P<drew_foul>{0})\))?').format(PLAYER_RE)
-    m = re.match(inboundRE, details, re.I)
-    if m:
+    if kind == 'inbound_foul':
         p['is_pf'] = True
         p['is_inbound_foul'] = True
         p.update(m.groupdict())
@@ -271,10 +468,7 @@ def parse_play(boxscore_id, details, is_hm):
         return p
 
     # parsing flagrant fouls
-    flagrantRE = (r'Flagrant foul type (?P<flag_type>1|2) by (?P<fouler>{0})'
-                  r'(?: \(drawn by (?P<drew_foul>{0})\))?').format(PLAYER_RE)
-    m = re.match(flagrantRE, details, re.I)
-    if m:
+    if kind == 'flagrant':
         p['is_pf'] = True
         p['is_flagrant'] = True
         p.update(m.groupdict())
@@ -283,10 +477,7 @@ def parse_play(boxscore_id, details, is_hm):
         return p
 
     # parsing clear path fouls
-    clearPathRE = (r'Clear path foul by (?P<fouler>{0})'
-                   r'(?: \(drawn by (?P<drew_foul>{0})\))?').format(PLAYER_RE)
-    m = re.match(clearPathRE, details, re.I)
-    if m:
+    if kind == 'clear_path_foul':
         p['is_pf'] = True
         p['is_clear_path_foul'] = True
         p.update(m.groupdict())
@@ -297,13 +488,11 @@ def parse_play(boxscore_id, details, is_hm):
         return p
 
     # parsing timeouts
-    timeoutRE = r'(?P<timeout_team>.*?) (?:full )?timeout'
-    m = re.match(timeoutRE, details, re.I)
-    if m:
+    if kind == 'timeout':
         p['is_timeout'] = True
         p.update(m.groupdict())
         isOfficialTO = p['timeout_team'].lower() == 'official'
-        name_to_id = season.team_names_to_ids()
+        name_to_id = context.team_names_to_ids()
         p['timeout_team'] = (
             'Official' if isOfficialTO else
             name_to_id.get(hm, name_to_id.get(aw, p['timeout_team']))
@@ -311,15 +500,7 @@ def parse_play(boxscore_id, details, is_hm):
         return p
 
     # parsing technical fouls
-    techRE = (r'(?P<is_hanging>Hanging )?'
-              r'(?P<is_taunting>Taunting )?'
-              r'(?P<is_ill_def>Ill def )?'
-              r'(?P<is_delay>Delay )?'
-              r'(?P<is_unsport>Non unsport )?'
-              r'tech(?:nical)? foul by '
-              r'(?P<tech_fouler>{0}|Team)').format(PLAYER_RE)
-    m = re.match(techRE, details, re.I)
-    if m:
+    if kind == 'tech_foul':
         p['is_tech_foul'] = True
         p.update(m.groupdict())
         p['is_hanging'] = bool(p['is_hanging'])
@@ -332,9 +513,7 @@ def parse_play(boxscore_id, details, is_hm):
         return p
 
     # parsing ejections
-    ejectRE = r'(?P<ejectee>{0}|Team) ejected from game'.format(PLAYER_RE)
-    m = re.match(ejectRE, details, re.I)
-    if m:
+    if kind == 'ejection':
         p['is_ejection'] = True
         p.update(m.groupdict())
         if p['ejectee'] == 'Team':
@@ -345,10 +524,7 @@ def parse_play(boxscore_id, details, is_hm):
         return p
 
     # parsing defensive 3 seconds techs
-    def3TechRE = (r'(?:Def 3 sec tech foul|Defensive three seconds)'
-                  r' by (?P<tech_fouler>{})').format(PLAYER_RE)
-    m = re.match(def3TechRE, details, re.I)
-    if m:
+    if kind == 'def_three_secs':
         p['is_tech_foul'] = True
         p['is_def_three_secs'] = True
         p.update(m.groupdict())
@@ -359,10 +535,7 @@ def parse_play(boxscore_id, details, is_hm):
         return p
 
     # parsing violations
-    violRE = (r'Violation by (?P<violator>{0}|Team) '
-              r'\((?P<viol_type>.*)\)').format(PLAYER_RE)
-    m = re.match(violRE, details, re.I)
-    if m:
+    if kind == 'viol':
         p['is_viol'] = True
         p.update(m.groupdict())
         if p['viol_type'] == 'kicked_ball':
@@ -412,6 +585,66 @@ def clean_features(df):
     return df
 
 
+def collapse_redundant_subs(df, poss_ids):
+    """Replaces the substitutions a team makes at the same time in the same
+    possession with their net effect, e.g. "A enters the game for B"
+    followed by "B enters the game for A" cancel out. The first sub rows of
+    each such group are rewritten as the net subs and the others are dropped.
+
+    :param df: DataFrame of a game's play-by-play data.
+    :param poss_ids: array of possession IDs for the rows of df, counting
+        rebounds as new possessions.
+    :returns: DataFrame without the redundant sub rows.
+    """
+    is_sub = df['is_sub'].values.astype(bool)
+    subs = df.loc[is_sub, ['secs_elapsed', 'sub_team', 'sub_in', 'sub_out']]
+    grp = subs.groupby(
+        [subs.secs_elapsed, subs.sub_team, np.asarray(poss_ids)[is_sub]],
+        sort=False
+    ).ngroup().fillna(-1).values.astype(int)
+    sizes = np.bincount(grp[grp >= 0], minlength=1)
+    multi = (grp >= 0) & (sizes[grp] > 1)
+    if not multi.any():
+        return df
+    subs = subs[multi]
+    grp = pd.factorize(grp[multi])[0]
+    n_groups = grp.max() + 1
+
+    # net number of times each player entered the game in each group, and
+    # the order in which the players first appear in the group
+    pos = np.arange(len(subs))
+    events = pd.DataFrame({
+        'grp': np.concatenate([grp, grp]),
+        'player': np.concatenate([subs.sub_in.values, subs.sub_out.values]),
+        'delta': np.repeat([1, -1], len(subs)),
+        'order': np.concatenate([2 * pos, 2 * pos + 1]),
+    })
+    net = (events.groupby(['grp', 'player'], sort=False)
+           .agg({'delta': 'sum', 'order': 'min'})
+           .reset_index()
+           .sort_values(['grp', 'order'], kind='mergesort'))
+    subbed_in = net[net.delta > 0]
+    subbed_out = net[net.delta < 0]
+    n_subs = np.bincount(subbed_in.grp, minlength=n_groups)
+    assert (n_subs == np.bincount(subbed_out.grp, minlength=n_groups)).all()
+
+    # rewrite the first n_subs rows of each group and drop the rest
+    row_num = pd.Series(grp).groupby(grp).cumcount().values
+    keep = row_num < n_subs[grp]
+    offsets = np.cumsum(n_subs) - n_subs
+    pair = offsets[grp[keep]] + row_num[keep]
+    p_in = subbed_in.player.values[pair]
+    p_out = subbed_out.player.values[pair]
+    idxs = subs.index[keep]
+    df.loc[idxs, 'sub_in'] = p_in
+    df.loc[idxs, 'sub_out'] = p_out
+    df.loc[idxs, 'detail'] = [
+        '{} enters the game for {}'.format(p_i, p_o)
+        for p_i, p_o in zip(p_in, p_out)
+    ]
+    return df.drop(subs.index[~keep], axis=0)
+
+
 def clean_multigame_features(df):
     """TODO: Docstring for clean_multigame_features.
 
@@ -434,82 +667,124 @@ def clean_multigame_features(df):
     return df
 
 
-def get_period_starters(df):
-    """TODO
-    """
+def _player_vocab(df):
+    """Returns the players in a game, whose positions in the returned array
+    are the integer codes used for them by :func:`get_lineup_codes`, along
+    with each player's team.
 
-    def players_from_play(play):
-        """Figures out what players are in the game based on the players
-        mentioned in a play. Returns away and home players as two sets.
+    :param df: A DataFrame of a game's play-by-play data.
+    :returns: (players, teams), where players is an array of player IDs and
+        teams is an int array that is 1 for home players, 0 for away players
+        and -1 for players found in substitutions but not in the box score.
+    """
+    bs = sportsref.nba.BoxScore(df.boxscore_id.iloc[0])
+    stats = bs.basic_stats()
+    stats = stats[stats.player_id.notnull()]
+    players = pd.Index(stats.player_id.values)
+    teams = stats.is_home.values.astype(int)
+    subbed = pd.unique(np.concatenate([df.sub_in.dropna().values,
+                                       df.sub_out.dropna().values]))
+    extra = pd.Index(subbed).difference(players)
+    players = np.concatenate([players.values, extra.values]).astype(object)
+    teams = np.concatenate([teams, np.full(len(extra), -1, dtype=int)])
+    return players, teams
+
+
+def _encode_players(values, players):
+    """Returns the codes of the given player IDs, with -1 for NaNs and
+    unknown players."""
+    return pd.Index(players).get_indexer(pd.Index(values, dtype=object))
+
+
+def _period_starters(df, players, teams):
+    """Figures out the starters of each period from the players mentioned in
+    its plays, without scanning the plays one at a time. A player mentioned
+    before being subbed in during a period started it. Starters are taken
+    from the plays up to the time when five starters have been found for
+    both teams.
 
-        :param play: A dictionary representing a parsed play.
-        :returns: (aw_players, hm_players)
-        :rtype: tuple of lists
-        """
-        # if it's a tech FT from between periods, don't count this play
-        if (
-            play['clock_time'] == '12:00.0' and
-            (play.get('is_tech_foul') or play.get('is_tech_fta'))
-        ):
-            return [], []
-
-        stats = sportsref.nba.BoxScore(play['boxscore_id']).basic_stats()
-        home_grouped = stats.groupby('is_home')
-        hm_roster = set(home_grouped.player_id.get_group(True).values)
-        aw_roster = set(home_grouped.player_id.get_group(False).values)
-        player_keys = [
-            'assister', 'away_jumper', 'blocker', 'drew_foul', 'fouler',
-            'ft_shooter', 'gains_poss', 'home_jumper', 'rebounder', 'shooter',
-            'stealer', 'sub_in', 'sub_out', 'to_by'
-        ]
-        players = [p for p in play[player_keys] if pd.notnull(p)]
-
-        aw_players = [p for p in players if p in aw_roster]
-        hm_players = [p for p in players if p in hm_roster]
-        return aw_players, hm_players
-
-    # create a mapping { quarter => (away_starters, home_starters) }
-    n_periods = df.quarter.nunique()
-    period_starters = [(set(), set()) for _ in range(n_periods)]
-
-    # fill out this mapping quarter by quarter
-    for qtr, qtr_grp in df.groupby(df.quarter):
-        aw_starters, hm_starters = period_starters[qtr-1]
-        exclude = set()
-        # loop through sets of plays that happen at the "same time"
-        for label, time_grp in qtr_grp.groupby(qtr_grp.secs_elapsed):
-            # first, if they sub in and weren't already starters, exclude them
-            sub_ins = set(time_grp.sub_in.dropna().values)
-            exclude.update(sub_ins - aw_starters - hm_starters)
-            # second, figure out new starters from each play at this time
-            for i, row in time_grp.iterrows():
-                aw_players, hm_players = players_from_play(row)
-                # update overall sets for the quarter
-                aw_starters.update(aw_players)
-                hm_starters.update(hm_players)
-            # remove excluded (subbed-in) players
-            hm_starters -= exclude
-            aw_starters -= exclude
-            # check whether we have found all starters
-            if len(hm_starters) > 5 or len(aw_starters) > 5:
-                import ipdb
-                ipdb.set_trace()
-            if len(hm_starters) >= 5 and len(aw_starters) >= 5:
-                break
-
-        if len(hm_starters) != 5 or len(aw_starters) != 5:
+    :param df: A DataFrame of a game's play-by-play data.
+    :param players: array of player IDs, as returned by :func:`_player_vocab`.
+    :param teams: array of the players' teams, as returned by
+        :func:`_player_vocab`.
+    :returns: int array with a row for each period of the codes of its away
+        starters and then its home starters, with -1 for any that are
+        missing.
+    """
+    quarter = df.quarter.values.astype(int) - 1
+    secs = df.secs_elapsed.values.astype(float)
+    n_periods = quarter.max() + 1
+
+    # codes of the players mentioned in each play, skipping technical FTs
+    # from between periods
+    keys = [key for key in PLAYER_KEYS if key in df.columns]
+    mentioned = np.column_stack([_encode_players(df[key].values, players)
+                                 for key in keys])
+    between_periods = (
+        (df.clock_time == '12:00.0') &
+        (df.get('is_tech_foul', False) | df.get('is_tech_fta', False))
+    ).values
+    mentioned[between_periods] = -1
+
+    # when each player is first mentioned and first subbed in each period
+    first_mention = np.full((n_periods, len(players)), np.inf)
+    rows, cols = np.nonzero(mentioned >= 0)
+    np.minimum.at(first_mention, (quarter[rows], mentioned[rows, cols]),
+                  secs[rows])
+    first_sub_in = np.full((n_periods, len(players)), np.inf)
+    sub_in = _encode_players(df.sub_in.values, players)
+    rows = np.flatnonzero(sub_in >= 0)
+    np.minimum.at(first_sub_in, (quarter[rows], sub_in[rows]), secs[rows])
+    started = np.where(first_mention < first_sub_in, first_mention, np.inf)
+
+    starters = np.full((n_periods, 10), -1, dtype=int)
+    for qtr in range(n_periods):
+        on_team = [teams == 0, teams == 1]
+        # stop once both teams have five starters
+        fifths = [np.sort(started[qtr, tm])[4] if tm.sum() >= 5 else np.inf
+                  for tm in on_team]
+        is_starter = started[qtr] <= max(fifths)
+        is_starter &= np.isfinite(started[qtr])
+        n_found = []
+        for i, tm in enumerate(on_team):
+            codes = np.flatnonzero(tm & is_starter)
+            codes = codes[np.argsort(started[qtr, codes], kind='mergesort')]
+            n_found.append(len(codes))
+            starters[qtr, 5*i:5*i + min(len(codes), 5)] = codes[:5]
+        if n_found != [5, 5]:
             print('WARNING: wrong number of starters for a team in Q{} of {}'
-                  .format(qtr, df.boxscore_id.iloc[0]))
+                  .format(qtr + 1, df.boxscore_id.iloc[0]))
+
+    return starters
+
+
+def get_period_starters(df):
+    """Returns the players who start each period of a game.
 
-    return period_starters
+    :param df: A DataFrame of a game's play-by-play data.
+    :returns: A list with a tuple of sets (away_starters, home_starters) of
+        player IDs for each period.
+    """
+    players, teams = _player_vocab(df)
+    starters = _period_starters(df, players, teams)
+    return [(set(players[row[:5][row[:5] >= 0]]),
+             set(players[row[5:][row[5:] >= 0]]))
+            for row in starters]
 
 
-def get_sparse_lineups(df):
+def get_sparse_lineups(df, sparse=False, players=None):
     """TODO: Docstring for get_sparse_lineups.
 
     :param df: TODO
+    :param sparse: If True, returns a scipy.sparse.csr_matrix and its player
+        IDs instead, as returned by :func:`get_lineup_matrix`. Defaults to
+        False.
+    :param players: Player IDs for the columns when sparse is True; see
+        :func:`get_lineup_matrix`.
     :returns: TODO
     """
+    if sparse:
+        return get_lineup_matrix(df, players)
 
     # get the lineup data using get_dense_lineups if necessary
     if (set(ALL_LINEUP_COLS) - set(df.columns)):
@@ -533,6 +808,157 @@ def get_sparse_lineups(df):
     return sparse_df
 
 
+def _lineup_ids(df):
+    """Returns an object array of the player IDs in the lineup columns for
+    each play of one or more games, computing the lineups of each game with
+    :func:`get_lineup_codes` if df doesn't have them."""
+    if set(ALL_LINEUP_COLS) <= set(df.columns):
+        return df[ALL_LINEUP_COLS].values
+    lineup_ids = np.empty((df.shape[0], 10), dtype=object)
+    games = df.reset_index(drop=True).groupby('boxscore_id', sort=False)
+    for bs_id, idxs in games.indices.items():
+        codes, game_players = get_lineup_codes(df.iloc[idxs])
+        lineup_ids[idxs] = np.append(game_players, np.nan)[codes]
+    return lineup_ids
+
+
+def get_lineup_matrix(df, players=None):
+    """Returns the lineups for each play as a sparse matrix with a column for
+    each player, which is 1 when the player is on the court for the home
+    team, -1 when on the court for the away team, and 0 otherwise (like
+    :func:`get_sparse_lineups`, without building a dense DataFrame).
+
+    The plays can be from many games, such as the concatenated results of
+    :func:`nba.BoxScore.pbp <nba.BoxScore.pbp>` for a season, as long as
+    each game's plays are in order.
+
+    :param df: A DataFrame of play-by-play data from one or more games. If it
+        has the columns in ALL_LINEUP_COLS, they are used as the lineups.
+    :param players: Player IDs for the first columns of the matrix, such as
+        the ones returned for other games, so that matrices built separately
+        share columns. Players not in it are added after them, sorted.
+        Defaults to no players.
+    :returns: (matrix, players), where matrix is a scipy.sparse.csr_matrix
+        with a row for each play and players is the array of player IDs for
+        its columns.
+    """
+    flat = _lineup_ids(df).ravel()
+    on_court = pd.notnull(flat)
+    vocab = pd.Index(players if players is not None else [], dtype=object)
+    new_players = pd.Index(pd.unique(flat[on_court])).difference(vocab)
+    vocab = vocab.append(new_players.sort_values())
+    cols = vocab.get_indexer(flat[on_court])
+
+    # -1 for the away players, then 1 for the home players, in each row
+    signs = np.tile(np.repeat([-1, 1], 5), df.shape[0])
+    rows = np.repeat(np.arange(df.shape[0]), 10)
+    matrix = scipy.sparse.csr_matrix(
+        (signs[on_court], (rows[on_court], cols)),
+        shape=(df.shape[0], len(vocab))
+    )
+    return matrix, vocab.values
+
+
+def get_lineup_codes(df):
+    """Figures out the players on the court for each play of a game, with
+    players encoded as small integers.
+
+    This information is figured out sequentially from the game's substitution
+    data in the passed DataFrame, so the DataFrame passed as an argument must
+    be from a specific BoxScore (rather than a DataFrame of non-consecutive
+    plays). That is, the DataFrame must be of the form returned by
+    :func:`nba.BoxScore.pbp <nba.BoxScore.pbp>`. As with
+    :func:`get_dense_lineups`, the lineups for a substitution are the lineups
+    before the substitution occurs.
+
+    :param df: A DataFrame of a game's play-by-play data.
+    :returns: (lineups, players), where lineups is an int array with a row
+        for each play and a column for each of ALL_LINEUP_COLS holding the
+        codes of the players on the court (-1 where unknown), and players is
+        the array of player IDs that the codes index into.
+    """
+    # TODO: add this precondition to documentation
+    assert df['boxscore_id'].nunique() == 1
+    df = df.reset_index(drop=True)
+    players, teams = _player_vocab(df)
+    starters = _period_starters(df, players, teams)
+
+    quarter = df.quarter.values.astype(int)
+    is_sub = df.is_sub.values.astype(bool)
+    sub_in = _encode_players(df.sub_in.values, players)
+    sub_out = _encode_players(df.sub_out.values, players)
+    sub_home = (df.sub_team == df.home).values
+    lineups = np.full((df.shape[0], 10), -1, dtype=int)
+
+    # start each period with its starters and apply its subs in order; each
+    # row gets the lineups from before its own sub
+    bounds = np.flatnonzero(np.diff(quarter)) + 1
+    for start, end in zip(np.r_[0, bounds], np.r_[bounds, df.shape[0]]):
+        lineup = starters[quarter[start] - 1].copy()
+        prev = start
+        for i in start + np.flatnonzero(is_sub[start:end]):
+            lineups[prev:i+1] = lineup
+            prev = i + 1
+            tm_lineup = lineup[5:] if sub_home[i] else lineup[:5]
+            slot = np.flatnonzero(tm_lineup == sub_out[i])
+            if sub_out[i] >= 0 and len(slot):
+                # make the sub
+                tm_lineup[slot[0]] = sub_in[i]
+            elif sub_in[i] in tm_lineup and (
+                sub_out[i] < 0 or sub_out[i] not in tm_lineup
+            ):
+                # the sub was double-entered and has already been executed
+                continue
+            else:
+                print('ERROR IN SUB IN {}, Q{}, {}: {}'
+                      .format(df.boxscore_id[i], df.quarter[i],
+                              df.clock_time[i], df.detail[i]))
+                raise ValueError('{} is not in the lineup'
+                                 .format(df.sub_out[i]))
+        lineups[prev:end] = lineup
+
+    if (lineups < 0).any():
+        _fill_missing_players(df, lineups, players, teams)
+
+    return lineups, players
+
+
+def _fill_missing_players(df, lineups, players, teams):
+    """Fills in unknown players in lineups, in place, when a team has one
+    player whose minutes in the box score are missing from the lineups."""
+    # first, get the true minutes played from the box score
+    stats = sportsref.nba.BoxScore(df.boxscore_id.iloc[0]).basic_stats()
+    played = stats[stats.mp > 0]
+    true_secs = pd.Series(played.mp.values * 60, index=played.player_id)
+    # next, calculate minutes played based on the lineup data
+    play_secs = np.nan_to_num(df.secs_elapsed.diff().values)
+    known = lineups >= 0
+    calc_secs = np.bincount(lineups[known],
+                            np.repeat(play_secs, 10)[known.ravel()],
+                            minlength=len(players))
+    calc_secs = pd.Series(calc_secs, index=players).reindex(true_secs.index)
+    # finally, figure which players are missing minutes
+    diff = true_secs - calc_secs
+    missing = _encode_players(diff.index[diff.abs() >= 150], players)
+
+    if not len(missing):
+        # TODO: log this as a warning (or error?)
+        print('There are NaNs in the lineup data, but no players were '
+              'found to be missing significant minutes')
+        return
+    for is_home in (0, 1):
+        tm_missing = missing[teams[missing] == is_home]
+        if len(tm_missing) != 1:
+            if len(tm_missing):
+                print('WARNING: several players missing minutes in {}'
+                      .format(df.boxscore_id.iloc[0]))
+            continue
+        tm_lineups = lineups[:, 5:] if is_home else lineups[:, :5]
+        rows = np.flatnonzero((tm_lineups < 0).any(axis=1))
+        slots = np.argmax(tm_lineups[rows] < 0, axis=1)
+        tm_lineups[rows, slots] = tm_missing[0]
+
+
 def get_dense_lineups(df):
     """Returns a new DataFrame based on the one it is passed. Specifically, it
     adds five columns for each team (ten total), where each column has the ID
@@ -553,122 +979,88 @@ def get_dense_lineups(df):
     :returns: A DataFrame with additional lineup columns.
 
     """
-    # TODO: add this precondition to documentation
-    assert df['boxscore_id'].nunique() == 1
+    lineups, players = get_lineup_codes(df)
+    # code -1 picks the NaN at the end
+    player_ids = np.append(players, np.nan)[lineups]
+    return pd.DataFrame(player_ids, columns=ALL_LINEUP_COLS)
 
-    def lineup_dict(aw_lineup, hm_lineup):
-        """Returns a dictionary of lineups to be converted to columns.
-        Specifically, the columns are 'aw_player1' through 'aw_player5' and
-        'hm_player1' through 'hm_player5'.
 
-        :param aw_lineup: The away team's current lineup.
-        :param hm_lineup: The home team's current lineup.
-        :returns: A dictionary of lineups.
-        """
-        return {
-            '{}_player{}'.format(tm, i+1): player
-            for tm, lineup in zip(['aw', 'hm'], [aw_lineup, hm_lineup])
-            for i, player in enumerate(lineup)
-        }
-
-    def handle_sub(row, aw_lineup, hm_lineup):
-        """Modifies the aw_lineup and hm_lineup lists based on the substitution
-        that takes place in the given row."""
-        assert row['is_sub']
-        sub_lineup = hm_lineup if row['sub_team'] == row['home'] else aw_lineup
-        try:
-            # make the sub
-            idx = sub_lineup.index(row['sub_out'])
-            sub_lineup[idx] = row['sub_in']
-        except ValueError:
-            # if the sub was double-entered and it's already been executed...
-            if (
-                row['sub_in'] in sub_lineup
-                and row['sub_out'] not in sub_lineup
-            ):
-                return aw_lineup, hm_lineup
-            # otherwise, let's print and pretend this never happened
-            print('ERROR IN SUB IN {}, Q{}, {}: {}'
-                  .format(row['boxscore_id'], row['quarter'],
-                          row['clock_time'], row['detail']))
-            raise
-        return aw_lineup, hm_lineup
-
-    per_starters = get_period_starters(df)
-    cur_qtr = 0
-    aw_lineup, hm_lineup = [], []
-    df = df.reset_index(drop=True)
-    lineups = [{} for _ in range(df.shape[0])]
-
-    # loop through select plays to determine lineups
-    sub_or_per_start = df.is_sub | df.quarter.diff().astype(bool)
-    for i, row in df.loc[sub_or_per_start].iterrows():
-        if row['quarter'] > cur_qtr:
-            # first row in a quarter
-            assert row['quarter'] == cur_qtr + 1
-            # first, finish up the last quarter's lineups
-            if cur_qtr > 0 and not df.loc[i-1, 'is_sub']:
-                lineups[i-1] = lineup_dict(aw_lineup, hm_lineup)
-            # then, move on to the quarter, and enter the starting lineups
-            cur_qtr += 1
-            aw_lineup, hm_lineup = map(list, per_starters[cur_qtr-1])
-            lineups[i] = lineup_dict(aw_lineup, hm_lineup)
-            # if the first play in the quarter is a sub, handle that
-            if row['is_sub']:
-                aw_lineup, hm_lineup = handle_sub(row, aw_lineup, hm_lineup)
-        else:
-            # during the quarter
-            # update lineups first then change lineups based on subs
-            lineups[i] = lineup_dict(aw_lineup, hm_lineup)
-            if row['is_sub']:
-                aw_lineup, hm_lineup = handle_sub(row, aw_lineup, hm_lineup)
-
-    # create and clean DataFrame
-    lineup_df = pd.DataFrame(lineups)
-    if lineup_df.iloc[-1].isnull().all():
-        lineup_df.iloc[-1] = lineup_dict(aw_lineup, hm_lineup)
-    lineup_df = lineup_df.groupby(df.quarter).fillna(method='bfill')
-
-    # fill in NaN's based on minutes played
-    bool_mat = lineup_df.isnull()
-    mask = bool_mat.any(axis=1)
-    if mask.any():
-        bs = sportsref.nba.BoxScore(df.boxscore_id[0])
-        # first, get the true minutes played from the box score
-        stats = sportsref.nba.BoxScore(df.boxscore_id.iloc[0]).basic_stats()
-        true_mp = pd.Series(
-            stats.query('mp > 0')[['player_id', 'mp']]
-            .set_index('player_id').to_dict()['mp']
-        ) * 60
-        # next, calculate minutes played based on the lineup data
-        calc_mp = pd.Series(
-            {p: (df.secs_elapsed.diff() *
-                 [p in row for row in lineup_df.values]).sum()
-             for p in stats.query('mp > 0').player_id.values})
-        # finally, figure which players are missing minutes
-        diff = true_mp - calc_mp
-        players_missing = diff.loc[diff.abs() >= 150]
-        hm_roster = bs.basic_stats().query('is_home == True').player_id.values
-        missing_df = pd.DataFrame(
-            {'secs': players_missing.values,
-             'is_home': players_missing.index.isin(hm_roster)},
-            index=players_missing.index
-        )
+STINT_COLS = ['boxscore_id', 'home', 'away', 'quarter', 'start_secs',
+              'end_secs', 'secs', 'n_plays', 'hm_poss', 'aw_poss', 'hm_pts',
+              'aw_pts'] + ALL_LINEUP_COLS
 
-        if missing_df.empty:
-            # TODO: log this as a warning (or error?)
-            print('There are NaNs in the lineup data, but no players were '
-                  'found to be missing significant minutes')
-        else:
-            # import ipdb
-            # ipdb.set_trace()
-            for is_home, group in missing_df.groupby('is_home'):
-                player_id = group.index.item()
-                tm_cols = (sportsref.nba.pbp.HM_LINEUP_COLS if is_home else
-                           sportsref.nba.pbp.AW_LINEUP_COLS)
-                row_mask = lineup_df[tm_cols].isnull().any(axis=1)
-                lineup_df.loc[row_mask, tm_cols] = (
-                    lineup_df.loc[row_mask, tm_cols].fillna(player_id).values
-                )
-
-    return lineup_df
+
+def lineup_stints(df):
+    """Splits play-by-play data into stints, the runs of consecutive plays in
+    a period of a game with the same ten players on the court, and totals
+    the time, possessions and points of each stint.
+
+    :param df: A DataFrame of play-by-play data from one or more games, as
+        returned by :func:`nba.BoxScore.pbp <nba.BoxScore.pbp>` (with or
+        without dense lineups), with each game's plays in order.
+    :returns: A DataFrame with a row for each stint and the columns in
+        STINT_COLS. The lineup columns have each team's players sorted by ID,
+        so equal lineups have equal rows.
+    """
+    df = df.reset_index(drop=True)
+    n = df.shape[0]
+    if not n:
+        return pd.DataFrame(columns=STINT_COLS)
+
+    # encode players in ID order and sort each team's five codes, so each
+    # row's codes are a key for its lineup
+    codes, players = pd.factorize(_lineup_ids(df).ravel(), sort=True)
+    codes = codes.reshape(n, 10)
+    codes = np.hstack([np.sort(codes[:, :5], axis=1),
+                       np.sort(codes[:, 5:], axis=1)])
+
+    # a stint starts with each game, period or lineup change
+    game = pd.factorize(df.boxscore_id)[0]
+    quarter = df.quarter.values
+    new_game = np.r_[True, game[1:] != game[:-1]]
+    new_period = new_game.copy()
+    new_period[1:] |= quarter[1:] != quarter[:-1]
+    new_stint = new_period.copy()
+    new_stint[1:] |= (codes[1:] != codes[:-1]).any(axis=1)
+    starts = np.flatnonzero(new_stint)
+    ends = np.r_[starts[1:], n] - 1
+
+    # the time since the previous play is played by each play's lineup; the
+    # first play of each period is credited with the time since it started
+    secs = df.secs_elapsed.values.astype(float)
+    q = quarter.astype(np.int64)
+    period_start = (720 * np.minimum(q - 1, 4) +
+                    300 * np.maximum(q - 5, 0))
+    play_secs = np.r_[0., np.diff(secs)]
+    play_secs[new_period] = (secs - period_start)[new_period]
+    # count the distinct poss_ids of each team's plays on offense
+    stint = np.cumsum(new_stint) - 1
+    poss = df.poss_id.values
+
+    def count_poss(on_offense):
+        rows = np.flatnonzero(on_offense)
+        if not len(rows):
+            return np.zeros(len(starts), dtype=np.int64)
+        first = np.r_[True, (stint[rows][1:] != stint[rows][:-1]) |
+                      (poss[rows][1:] != poss[rows][:-1])]
+        return np.bincount(stint[rows][first], minlength=len(starts))
+
+    stints = pd.DataFrame({
+        'boxscore_id': df.boxscore_id.values[starts],
+        'home': df.home.values[starts],
+        'away': df.away.values[starts],
+        'quarter': quarter[starts],
+        'start_secs': secs[starts] - play_secs[starts],
+        'end_secs': secs[ends],
+        'secs': np.add.reduceat(play_secs, starts),
+        'n_plays': ends - starts + 1,
+        'hm_poss': count_poss((df.off_team == df.home).values),
+        'aw_poss': count_poss((df.off_team == df.away).values),
+        'hm_pts': np.add.reduceat(df.hm_pts.values, starts),
+        'aw_pts': np.add.reduceat(df.aw_pts.values, starts),
+    }, columns=STINT_COLS[:-10])
+    # code -1 picks the NaN at the end
+    player_ids = np.append(players, np.nan)[codes[starts]]
+    for i, col in enumerate(ALL_LINEUP_COLS):
+        stints[col] = player_ids[:, i]
+    return stints
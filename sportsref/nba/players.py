@@ -41,6 +41,9 @@ class Player(future.utils.with_metaclass(sportsref.decorators.Cached, object)):
     def __str__(self):
         return self.name()
 
+    def __reduce__(self):
+        return sportsref.decorators.reduce_instance(self, self.player_id)
+
     @sportsref.decorators.memoize
     def get_main_doc(self):
         return pq(sportsref.utils.get_html(self.main_url))
@@ -156,37 +159,37 @@ class Player(future.utils.with_metaclass(sportsref.decorators.Cached, object)):
                                          footer=summary)
         return df
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(persist=True)
     def stats_per_game(self, kind='R', summary=False):
         """Returns a DataFrame of per-game box score stats."""
         return self._get_stats_table('per_game', kind=kind, summary=summary)
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(persist=True)
     def stats_totals(self, kind='R', summary=False):
         """Returns a DataFrame of total box score statistics by season."""
         return self._get_stats_table('totals', kind=kind, summary=summary)
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(persist=True)
     def stats_per36(self, kind='R', summary=False):
         """Returns a DataFrame of per-36-minutes stats."""
         return self._get_stats_table('per_minute', kind=kind, summary=summary)
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(persist=True)
     def stats_per100(self, kind='R', summary=False):
         """Returns a DataFrame of per-100-possession stats."""
         return self._get_stats_table('per_poss', kind=kind, summary=summary)
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(persist=True)
     def stats_advanced(self, kind='R', summary=False):
         """Returns a DataFrame of advanced stats."""
         return self._get_stats_table('advanced', kind=kind, summary=summary)
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(persist=True)
     def stats_shooting(self, kind='R', summary=False):
         """Returns a DataFrame of shooting stats."""
         return self._get_stats_table('shooting', kind=kind, summary=summary)
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(persist=True)
     def stats_pbp(self, kind='R', summary=False):
         """Returns a DataFrame of play-by-play stats."""
         return self._get_stats_table('advanced_pbp', kind=kind,
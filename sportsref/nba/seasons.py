@@ -36,18 +36,28 @@ class Season(future.utils.with_metaclass(sportsref.decorators.Cached, object)):
     def __repr__(self):
         return 'Season({})'.format(self.yr)
 
+    def __reduce__(self):
+        return sportsref.decorators.reduce_instance(self, self.yr)
+
     def _subpage_url(self, page):
         return (sportsref.nba.BASE_URL +
                 '/leagues/NBA_{}_{}.html'.format(self.yr, page))
 
+    @sportsref.decorators.memoize(frozen=True)
+    def get_main_html(self):
+        """Returns the HTML of the main season URL.
+        :returns: string of HTML.
+        """
+        url = (sportsref.nba.BASE_URL +
+               '/leagues/NBA_{}.html'.format(self.yr))
+        return sportsref.utils.get_html(url)
+
     @sportsref.decorators.memoize
     def get_main_doc(self):
         """Returns PyQuery object for the main season URL.
         :returns: PyQuery object.
         """
-        url = (sportsref.nba.BASE_URL +
-               '/leagues/NBA_{}.html'.format(self.yr))
-        return pq(sportsref.utils.get_html(url))
+        return pq(self.get_main_html())
 
     @sportsref.decorators.memoize
     def get_sub_doc(self, subpage):
@@ -86,7 +96,7 @@ class Season(future.utils.with_metaclass(sportsref.decorators.Cached, object)):
             raise Exception("team names and team IDs don't align")
         return dict(zip(team_ids, team_names))
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(frozen=True)
     def team_names_to_ids(self):
         """Mapping from full team names to 3-letter team IDs.
         :returns: Dictionary with tean names as keys and team IDs as values.
@@ -94,7 +104,7 @@ class Season(future.utils.with_metaclass(sportsref.decorators.Cached, object)):
         d = self.team_ids_to_names()
         return {v: k for k, v in d.items()}
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(persist=True)
     @sportsref.decorators.kind_rpb(include_type=True)
     def schedule(self, kind='R'):
         """Returns a list of BoxScore IDs for every game in the season.
@@ -141,6 +151,57 @@ class Season(future.utils.with_metaclass(sportsref.decorators.Cached, object)):
         else:
             return df.iloc[:n_reg_games]
 
+    def lineup_stints(self, kind='R', partial=False):
+        """Returns the lineup stints of every game in the season, as returned
+        by :func:`nba.pbp.lineup_stints <nba.pbp.lineup_stints>`.
+
+        :param kind: 'R' for regular season, 'P' for playoffs, 'B' for both.
+            Defaults to 'R'.
+        :param partial: if True, games whose play-by-play can't be fetched or
+            parsed are skipped with a warning; otherwise, a ValueError is
+            raised. Only complete results are cached. Defaults to False.
+        :returns: DataFrame of stints.
+        :rtype: pd.DataFrame
+        """
+        if not partial:
+            return self._complete_lineup_stints(kind)
+        dfs, errors = self._game_lineup_stints(kind)
+        for bs_id, e in errors.items():
+            print('WARNING: skipping {}: {!r}'.format(bs_id, e))
+        return self._concat_stints(dfs)
+
+    @sportsref.decorators.memoize(persist=True)
+    def _complete_lineup_stints(self, kind):
+        dfs, errors = self._game_lineup_stints(kind)
+        if errors:
+            raise ValueError(
+                'could not get lineup stints for {} of the games in {}: {}'
+                .format(len(errors), self, ', '.join(
+                    '{} ({!r})'.format(bs_id, e)
+                    for bs_id, e in errors.items()
+                ))
+            )
+        return self._concat_stints(dfs)
+
+    def _game_lineup_stints(self, kind):
+        """Returns a tuple of (list of each game's stints DataFrame, dict
+        mapping boxscore IDs to the exception raised for that game)."""
+        dfs = []
+        errors = {}
+        for bs_id in self.schedule(kind=kind)['boxscore_id']:
+            try:
+                pbp = sportsref.nba.BoxScore(bs_id).pbp()
+                dfs.append(sportsref.nba.pbp.lineup_stints(pbp))
+            except Exception as e:
+                errors[bs_id] = e
+        return dfs, errors
+
+    @staticmethod
+    def _concat_stints(dfs):
+        if not dfs:
+            return pd.DataFrame(columns=sportsref.nba.pbp.STINT_COLS)
+        return pd.concat(dfs, ignore_index=True)
+
     def finals_winner(self):
         """Returns the team ID for the winner of that year's NBA Finals.
         :returns: 3-letter team ID for champ.
@@ -182,11 +243,11 @@ class Season(future.utils.with_metaclass(sportsref.decorators.Cached, object)):
         return full_df
 
     @sportsref.decorators.memoize
-    def _get_team_stats_table(self, selector):
+    def _get_team_stats_table(self, table_id):
         """Helper function for stats tables on season pages. Returns a
         DataFrame."""
-        doc = self.get_main_doc()
-        table = doc(selector)
+        html = self.get_main_html()
+        table = sportsref.utils.extract_tables(html, [table_id])[table_id]
         df = sportsref.utils.parse_table(table)
         df.set_index('team_id', inplace=True)
         return df
@@ -194,47 +255,48 @@ class Season(future.utils.with_metaclass(sportsref.decorators.Cached, object)):
     def team_stats_per_game(self):
         """Returns a Pandas DataFrame of each team's basic per-game stats for
         the season."""
-        return self._get_team_stats_table('table#team-stats-per_game')
+        return self._get_team_stats_table('team-stats-per_game')
 
     def opp_stats_per_game(self):
         """Returns a Pandas DataFrame of each team's opponent's basic per-game
         stats for the season."""
-        return self._get_team_stats_table('table#opponent-stats-per_game')
+        return self._get_team_stats_table('opponent-stats-per_game')
 
     def team_stats_totals(self):
         """Returns a Pandas DataFrame of each team's basic stat totals for the
         season."""
-        return self._get_team_stats_table('table#team-stats-base')
+        return self._get_team_stats_table('team-stats-base')
 
     def opp_stats_totals(self):
         """Returns a Pandas DataFrame of each team's opponent's basic stat
         totals for the season."""
-        return self._get_team_stats_table('table#opponent-stats-base')
+        return self._get_team_stats_table('opponent-stats-base')
 
     def misc_stats(self):
         """Returns a Pandas DataFrame of miscellaneous stats about each team's
         season."""
-        return self._get_team_stats_table('table#misc_stats')
+        return self._get_team_stats_table('misc_stats')
 
     def team_stats_shooting(self):
         """Returns a Pandas DataFrame of each team's shooting stats for the
         season."""
-        return self._get_team_stats_table('table#team_shooting')
+        return self._get_team_stats_table('team_shooting')
 
     def opp_stats_shooting(self):
         """Returns a Pandas DataFrame of each team's opponent's shooting stats
         for the season."""
-        return self._get_team_stats_table('table#opponent_shooting')
+        return self._get_team_stats_table('opponent_shooting')
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(persist=True)
     def _get_player_stats_table(self, identifier):
         """Helper function for player season stats.
 
         :identifier: string identifying the type of stat, e.g. 'per_game'.
         :returns: A DataFrame of stats.
         """
-        doc = self.get_sub_doc(identifier)
-        table = doc('table#{}_stats'.format(identifier))
+        html = sportsref.utils.get_html(self._subpage_url(identifier))
+        table_id = '{}_stats'.format(identifier)
+        table = sportsref.utils.extract_tables(html, [table_id])[table_id]
         df = sportsref.utils.parse_table(table)
         return df
 
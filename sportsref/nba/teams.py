@@ -18,6 +18,9 @@ class Team(future.utils.with_metaclass(sportsref.decorators.Cached, object)):
     def __hash__(self):
         return hash(self.team_id)
 
+    def __reduce__(self):
+        return sportsref.decorators.reduce_instance(self, self.team_id)
+
     @sportsref.decorators.memoize
     def team_year_url(self, yr_str):
         return (sportsref.nba.BASE_URL +
@@ -87,7 +87,7 @@ class BoxScore(
         )
 
     def __reduce__(self):
-        return BoxScore, (self.boxscore_id,)
+        return sportsref.decorators.reduce_instance(self, self.boxscore_id)
 
     @sportsref.decorators.memoize
     def get_doc(self):
@@ -96,6 +96,14 @@ class BoxScore(
         doc = pq(sportsref.utils.get_html(url))
         return doc
 
+    @sportsref.decorators.memoize(frozen=True)
+    def _tables(self):
+        """Returns the tables on the boxscore page, which are indexed and
+        parsed once for all of the methods that use them.
+        :returns: sportsref.utils.PageTables object.
+        """
+        return sportsref.utils.PageTables(self.get_doc())
+
     @sportsref.decorators.memoize
     def date(self):
         """
@@ -200,7 +208,7 @@ class BoxScore(
         date = self.date()
         return date.year - 1 if date.month <= 3 else date.year
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(persist=True)
     def starters(self):
         """Returns a DataFrame where each row is an entry in the starters table
         from PFR.
@@ -219,9 +227,9 @@ class BoxScore(
 
         :returns: A pandas DataFrame. See the description for details.
         """
-        doc = self.get_doc()
-        h = doc('#home_starters')
-        a = doc('#vis_starters')
+        tables = self._tables()
+        h = tables.table('home_starters')
+        a = tables.table('vis_starters')
         data = []
         for h, table in enumerate((a, h)):
             if h: team = self.home()
@@ -261,9 +269,7 @@ class BoxScore(
 
     @sportsref.decorators.memoize
     def line(self):
-        doc = self.get_doc()
-        table = doc('table#game_info')
-        giTable = sportsref.utils.parse_info_table(table)
+        giTable = self._tables().parse_info_table('game_info')
         line_text = giTable.get('vegas_line', None)
         if line_text is None:
             return np.nan
@@ -286,9 +292,7 @@ class BoxScore(
         :returns: string representing the type of surface. Returns np.nan if
         not avaiable.
         """
-        doc = self.get_doc()
-        table = doc('table#game_info')
-        giTable = sportsref.utils.parse_info_table(table)
+        giTable = self._tables().parse_info_table('game_info')
         return giTable.get('surface', np.nan)
 
     @sportsref.decorators.memoize
@@ -298,9 +302,7 @@ class BoxScore(
         :returns: string representing the roof of stadium. Returns np.nan if
         not avaiable.
         """
-        doc = self.get_doc()
-        table = doc('table#game_info')
-        giTable = sportsref.utils.parse_info_table(table)
+        giTable = self._tables().parse_info_table('game_info')
         return giTable.get('roof', np.nan)
 
 
@@ -310,9 +312,7 @@ class BoxScore(
         Returns the over/under for the game as a float, or np.nan if not
         available.
         """
-        doc = self.get_doc()
-        table = doc('table#game_info')
-        giTable = sportsref.utils.parse_info_table(table)
+        giTable = self._tables().parse_info_table('game_info')
         if 'over_under' in giTable:
             ou = giTable['over_under']
             return float(ou.split()[0])
@@ -329,9 +329,7 @@ class BoxScore(
 
         :returns: Dictionary of coin toss-related info.
         """
-        doc = self.get_doc()
-        table = doc('table#game_info')
-        giTable = sportsref.utils.parse_info_table(table)
+        giTable = self._tables().parse_info_table('game_info')
         if 'Won Toss' in giTable:
             # TODO: finish coinToss function
             pass
@@ -350,9 +348,7 @@ class BoxScore(
 
         :returns: Dict of weather data.
         """
-        doc = self.get_doc()
-        table = doc('table#game_info')
-        giTable = sportsref.utils.parse_info_table(table)
+        giTable = self._tables().parse_info_table('game_info')
         if 'weather' in giTable:
             regex = (
                 r'(?:(?P<temp>\-?\d+) degrees )?'
@@ -382,7 +378,7 @@ class BoxScore(
                 'temp': 70, 'wind_chill': 70, 'humidity': None, 'wind_mph': 0
             }
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(persist=True)
     def pbp(self):
         """Returns a dataframe of the play-by-play data from the game.
 
@@ -396,9 +392,7 @@ class BoxScore(
 
         :returns: pandas DataFrame of play-by-play. Similar to GPF.
         """
-        doc = self.get_doc()
-        table = doc('table#pbp')
-        df = sportsref.utils.parse_table(table)
+        df = self._tables().parse_table('pbp')
         # make the following features conveniently available on each row
         df['boxscore_id'] = self.boxscore_id
         df['home'] = self.home()
@@ -457,35 +451,30 @@ class BoxScore(
 
         :returns: A dictionary of ref positions and IDs.
         """
-        doc = self.get_doc()
-        table = doc('table#officials')
-        return sportsref.utils.parse_info_table(table)
+        return self._tables().parse_info_table('officials')
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(persist=True)
     def player_stats(self):
         """Gets the stats for offense, defense, returning, and kicking of
         individual players in the game.
         :returns: A DataFrame containing individual player stats.
         """
-        doc = self.get_doc()
+        tables = self._tables()
         tableIDs = ('player_offense', 'player_defense', 'returns', 'kicking')
         dfs = []
         for tID in tableIDs:
-            table = doc('table#{}'.format(tID))
-            dfs.append(sportsref.utils.parse_table(table))
+            dfs.append(tables.parse_table(tID))
         df = pd.concat(dfs, ignore_index=True)
         df = df.reset_index(drop=True)
         df['team'] = df['team'].str.lower()
         return df
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(persist=True)
     def stats_team(self):
         """Gets the summarized stats for each team.
         :returns: A DataFrame containing team stats.
         """
-        doc = self.get_doc()
-        table = doc('#team_stats')
-        df = sportsref.utils.parse_table(table)
+        df = self._tables().parse_table('team_stats')
         if not df.empty:
             df = df.transpose()
             df.columns = df.iloc[0]
@@ -589,14 +578,12 @@ class BoxScore(
         df = df[cols]
         return df
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(persist=True)
     def stats_offense(self):
         """Gets the stats for offense of individual players in the game.
         :returns: A DataFrame containing individual player stats.
         """
-        doc = self.get_doc()
-        table = doc('#player_offense')
-        df = sportsref.utils.parse_table(table)
+        df = self._tables().parse_table('player_offense')
         if not df.empty:
             df['boxscore_id'] = self.boxscore_id
             df['season'] = self.season()
@@ -632,14 +619,12 @@ class BoxScore(
         df = df[cols]
         return df
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(persist=True)
     def stats_defense(self):
         """Gets the stats for defense of individual players in the game.
         :returns: A DataFrame containing individual player stats.
         """
-        doc = self.get_doc()
-        table = doc('#player_defense')
-        df = sportsref.utils.parse_table(table)
+        df = self._tables().parse_table('player_defense')
         # make sure all cols are in the df
         if not df.empty:
             df['boxscore_id'] = self.boxscore_id
@@ -657,14 +642,12 @@ class BoxScore(
         df = df[cols]
         return df
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(persist=True)
     def stats_returns(self):
         """Gets the stats for returns of individual players in the game.
         :returns: A DataFrame containing individual player stats.
         """
-        doc = self.get_doc()
-        table = doc('#returns')
-        df = sportsref.utils.parse_table(table)
+        df = self._tables().parse_table('returns')
         if not df.empty:
             df['boxscore_id'] = self.boxscore_id
             df['season'] = self.season()
@@ -680,14 +663,12 @@ class BoxScore(
         df = df[cols]
         return df
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(persist=True)
     def stats_kicking(self):
         """Gets the stats for kicking of individual players in the game.
         :returns: A DataFrame containing individual player stats.
         """
-        doc = self.get_doc()
-        table = doc('#kicking')
-        df = sportsref.utils.parse_table(table)
+        df = self._tables().parse_table('kicking')
         if not df.empty:
             df['boxscore_id'] = self.boxscore_id
             df['season'] = self.season()
@@ -712,14 +693,12 @@ class BoxScore(
         df = df[cols]
         return df
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(persist=True)
     def pass_directions(self):
         """Gets the stats for kicking of individual players in the game.
         :returns: A DataFrame containing individual player stats.
         """
-        doc = self.get_doc()
-        table = doc('#targets_directions')
-        df = sportsref.utils.parse_table(table)
+        df = self._tables().parse_table('targets_directions')
         if not df.empty:
             df['boxscore_id'] = self.boxscore_id
             df['season'] = self.season()
@@ -757,18 +736,16 @@ class BoxScore(
         df = df[cols]
         return df
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(persist=True)
     def snap_counts(self):
         """Gets the snap counts of individual players in the game.
         :returns: A DataFrame containing individual player stats.
         """
-        doc = self.get_doc()
-        table = doc('#home_snap_counts')
-        dfH = sportsref.utils.parse_table(table)
+        tables = self._tables()
+        dfH = tables.parse_table('home_snap_counts')
         if not dfH.empty:
             dfH['team'] = self.home()
-        table = doc('#vis_snap_counts')
-        dfV = sportsref.utils.parse_table(table)
+        dfV = tables.parse_table('vis_snap_counts')
         if not dfV.empty:
             dfV['team'] = self.away()
         df = pd.concat([dfH, dfV], ignore_index=True)
@@ -799,7 +776,7 @@ class BoxScore(
         df = df.reset_index(drop=True)
         return df
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(persist=True)
     def game_info(self):
         """Returns a one row dataframe of game info.
 
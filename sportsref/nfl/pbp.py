@@ -52,19 +52,11 @@ def expand_details(df, detailCol='detail'):
     return new_df
 
 
-@sportsref.decorators.memoize
-def parse_play_details(details):
-    """Parses play details from play-by-play string and returns structured
-    data.
+def _compile_play_regexes():
+    """Compiles the regexes used by :func:`parse_play_details`.
 
-    :details: detail string for play
-    :returns: dictionary of play attributes
+    :returns: dict mapping play types to compiled regexes.
     """
-
-    # if input isn't a string, return None
-    if not isinstance(details, basestring):
-        return None
-
     rushOptRE = r'(?P<rushDir>{})'.format(
         r'|'.join(RUSH_OPTS.keys())
     )
@@ -74,30 +66,12 @@ def parse_play_details(details):
 
     playerRE = r"\S{6,8}\d{2}"
 
-    # initialize return dictionary - struct
-    struct = {}
-
-    # handle challenges
-    # TODO: record the play both before & after an overturned challenge
+    # create challenge regex
     challengeRE = re.compile(
         r'.+\. (?P<challenger>.+?) challenged.*? the play was '
         '(?P<callUpheld>upheld|overturned)\.',
         re.IGNORECASE
     )
-    match = challengeRE.search(details)
-    if match:
-        struct['isChallenge'] = True
-        struct.update(match.groupdict())
-        # if overturned, only record updated play
-        if 'overturned' in details:
-            overturnedIdx = details.index('overturned.')
-            newStart = overturnedIdx + len('overturned.')
-            details = details[newStart:].strip()
-    else:
-        struct['isChallenge'] = False
-
-    # TODO: expand on laterals
-    struct['isLateral'] = details.find('lateral') != -1
 
     # create rushing regex
     rusherRE = r"(?P<rusher>{0})".format(playerRE)
@@ -263,8 +237,95 @@ def parse_play_details(details):
         r'.*?(?: \(no play\)))')
     psPenaltyRE = re.compile(psPenaltyREstr, re.IGNORECASE)
 
+    return {
+        'challenge': challengeRE,
+        'kickoff': kickoffRE,
+        'timeout': timeoutRE,
+        'fieldGoal': fgRE,
+        'punt': puntRE,
+        'kneel': kneelRE,
+        'spike': spikeRE,
+        'extraPoint': extraPointRE,
+        'twoPoint': twoPointRE,
+        'pass': passRE,
+        'presnapPenalty': psPenaltyRE,
+        'rush': rushRE,
+    }
+
+
+# compiled once at import; parse_play_details only tries the regexes whose
+# keywords appear in the details string
+PLAY_REGEXES = _compile_play_regexes()
+
+# lowercase substrings, at least one of which must appear in a play's details
+# for the corresponding regex to match it (the rush regex has none)
+PLAY_KEYWORDS = {
+    'challenge': (' challenged',),
+    'kickoff': (' kicks off', ' kicks onside'),
+    'timeout': ('timeout #',),
+    'fieldGoal': (' yard field goal ',),
+    'punt': (' punts',),
+    'kneel': (' kneels for ',),
+    'spike': (' spiked the ball',),
+    'extraPoint': ('extra point ',),
+    'twoPoint': ('two point attempt: ',),
+    'pass': (' sacked ', ' pass complete', ' pass incomplete'),
+    'presnapPenalty': ('penalty on ',),
+}
+
+
+def _search_play(play_type, details, lowered):
+    """Searches details with the regex for a play type, skipping the search
+    when none of the play type's keywords appear.
+
+    :play_type: key of PLAY_REGEXES.
+    :details: detail string for play.
+    :lowered: details.lower().
+    :returns: match object, or None.
+    """
+    keywords = PLAY_KEYWORDS.get(play_type)
+    if keywords and not any(kw in lowered for kw in keywords):
+        return None
+    return PLAY_REGEXES[play_type].search(details)
+
+
+@sportsref.decorators.memoize
+def parse_play_details(details):
+    """Parses play details from play-by-play string and returns structured
+    data.
+
+    :details: detail string for play
+    :returns: dictionary of play attributes
+    """
+
+    # if input isn't a string, return None
+    if not isinstance(details, basestring):
+        return None
+
+    # initialize return dictionary - struct
+    struct = {}
+
+    # handle challenges
+    # TODO: record the play both before & after an overturned challenge
+    match = _search_play('challenge', details, details.lower())
+    if match:
+        struct['isChallenge'] = True
+        struct.update(match.groupdict())
+        # if overturned, only record updated play
+        if 'overturned' in details:
+            overturnedIdx = details.index('overturned.')
+            newStart = overturnedIdx + len('overturned.')
+            details = details[newStart:].strip()
+    else:
+        struct['isChallenge'] = False
+
+    # TODO: expand on laterals
+    struct['isLateral'] = details.find('lateral') != -1
+
+    lowered = details.lower()
+
     # try parsing as a kickoff
-    match = kickoffRE.search(details)
+    match = _search_play('kickoff', details, lowered)
     if match:
         # parse as a kickoff
         struct['isKickoff'] = True
@@ -272,7 +333,7 @@ def parse_play_details(details):
         return struct
 
     # try parsing as a timeout
-    match = timeoutRE.search(details)
+    match = _search_play('timeout', details, lowered)
     if match:
         # parse as timeout
         struct['isTimeout'] = True
@@ -280,7 +341,7 @@ def parse_play_details(details):
         return struct
 
     # try parsing as a field goal
-    match = fgRE.search(details)
+    match = _search_play('fieldGoal', details, lowered)
     if match:
         # parse as a field goal
         struct['isFieldGoal'] = True
@@ -288,7 +349,7 @@ def parse_play_details(details):
         return struct
 
     # try parsing as a punt
-    match = puntRE.search(details)
+    match = _search_play('punt', details, lowered)
     if match:
         # parse as a punt
         struct['isPunt'] = True
@@ -296,7 +357,7 @@ def parse_play_details(details):
         return struct
 
     # try parsing as a kneel
-    match = kneelRE.search(details)
+    match = _search_play('kneel', details, lowered)
     if match:
         # parse as a kneel
         struct['isKneel'] = True
@@ -304,7 +365,7 @@ def parse_play_details(details):
         return struct
 
     # try parsing as a spike
-    match = spikeRE.search(details)
+    match = _search_play('spike', details, lowered)
     if match:
         # parse as a spike
         struct['isSpike'] = True
@@ -312,7 +373,7 @@ def parse_play_details(details):
         return struct
 
     # try parsing as an XP
-    match = extraPointRE.search(details)
+    match = _search_play('extraPoint', details, lowered)
     if match:
         # parse as an XP
         struct['isXP'] = True
@@ -320,7 +381,7 @@ def parse_play_details(details):
         return struct
 
     # try parsing as a 2-point conversion
-    match = twoPointRE.search(details)
+    match = _search_play('twoPoint', details, lowered)
     if match:
         # parse as a 2-point conversion
         struct['isTwoPoint'] = True
@@ -332,7 +393,7 @@ def parse_play_details(details):
         return struct
 
     # try parsing as a pass
-    match = passRE.search(details)
+    match = _search_play('pass', details, lowered)
     if match:
         # parse as a pass
         struct['isPass'] = True
@@ -340,7 +401,7 @@ def parse_play_details(details):
         return struct
 
     # try parsing as a pre-snap penalty
-    match = psPenaltyRE.search(details)
+    match = _search_play('presnapPenalty', details, lowered)
     if match:
         # parse as a pre-snap penalty
         struct['isPresnapPenalty'] = True
@@ -348,7 +409,7 @@ def parse_play_details(details):
         return struct
 
     # try parsing as a run
-    match = rushRE.search(details)
+    match = _search_play('rush', details, lowered)
     if match:
         # parse as a run
         struct['isRun'] = True
@@ -39,7 +39,7 @@ class Player(future.utils.with_metaclass(sportsref.decorators.Cached, object)):
         return self.name()
 
     def __reduce__(self):
-        return Player, (self.player_id,)
+        return sportsref.decorators.reduce_instance(self, self.player_id)
 
     def _subpage_url(self, page, year=None):
         # if no year, return career version
@@ -191,7 +191,7 @@ class Player(future.utils.with_metaclass(sportsref.decorators.Cached, object)):
         hs = re.search(r'High School:\s*(\S+)', cleanedText).group(1)
         return hs
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(persist=True)
     @sportsref.decorators.kind_rpb(include_type=True)
     def gamelog(self, year=None, kind='R'):
         """Gets the career gamelog of the given player.
@@ -210,7 +210,7 @@ class Player(future.utils.with_metaclass(sportsref.decorators.Cached, object)):
             df = df.query('year == @year').reset_index(drop=True)
         return df
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(persist=True)
     @sportsref.decorators.kind_rpb(include_type=True)
     def passing(self, kind='R'):
         """Gets yearly passing stats for the player.
@@ -224,7 +224,7 @@ class Player(future.utils.with_metaclass(sportsref.decorators.Cached, object)):
         df = sportsref.utils.parse_table(table)
         return df
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(persist=True)
     @sportsref.decorators.kind_rpb(include_type=True)
     def rushing_and_receiving(self, kind='R'):
         """Gets yearly rushing/receiving stats for the player.
@@ -241,7 +241,7 @@ class Player(future.utils.with_metaclass(sportsref.decorators.Cached, object)):
         df = sportsref.utils.parse_table(table)
         return df
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(persist=True)
     @sportsref.decorators.kind_rpb(include_type=True)
     def defense(self, kind='R'):
         """Gets yearly defense stats for the player (also has AV stats for OL).
@@ -280,7 +280,7 @@ class Player(future.utils.with_metaclass(sportsref.decorators.Cached, object)):
         else:
             return None
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(persist=True)
     def passing_plays(self, year, expand_details=True):
         """Returns a pbp DataFrame of a player's passing plays in a season.
 
@@ -290,7 +290,7 @@ class Player(future.utils.with_metaclass(sportsref.decorators.Cached, object)):
         """
         return self._plays(year, 'passing', expand_details)
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(persist=True)
     def rushing_plays(self, year, expand_details=True):
         """Returns a pbp DataFrame of a player's rushing plays in a season.
 
@@ -300,7 +300,7 @@ class Player(future.utils.with_metaclass(sportsref.decorators.Cached, object)):
         """
         return self._plays(year, 'rushing', expand_details)
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(persist=True)
     def receiving_plays(self, year, expand_details=True):
         """Returns a pbp DataFrame of a player's receiving plays in a season.
 
@@ -310,7 +310,7 @@ class Player(future.utils.with_metaclass(sportsref.decorators.Cached, object)):
         """
         return self._plays(year, 'receiving', expand_details)
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(persist=True)
     def splits(self, year=None):
         """Returns a DataFrame of splits data for a player-year.
 
@@ -328,7 +328,7 @@ class Player(future.utils.with_metaclass(sportsref.decorators.Cached, object)):
             df.split_id.fillna(method='ffill', inplace=True)
         return df
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(persist=True)
     def advanced_splits(self, year=None):
         """Returns a DataFrame of advanced splits data for a player-year. Note:
             only go back to 2012.
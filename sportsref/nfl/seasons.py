@@ -30,6 +30,9 @@ class Season(future.utils.with_metaclass(sportsref.decorators.Cached, object)):
     def __repr__(self):
         return 'Season({})'.format(self.year)
 
+    def __reduce__(self):
+        return sportsref.decorators.reduce_instance(self, self.year)
+
     def _subpage_url(self, page):
         return (sportsref.nfl.BASE_URL +
                 '/years/{}/{}.htm'.format(self.year, page))
@@ -74,7 +77,7 @@ class Season(future.utils.with_metaclass(sportsref.decorators.Cached, object)):
         """
         return sportsref.nfl.teams.team_ids(self.year)
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(persist=True)
     def get_draft_info(self):
         """Returns a dataframe with draft info from the season.
         """
@@ -91,7 +94,7 @@ class Season(future.utils.with_metaclass(sportsref.decorators.Cached, object)):
         df = df[cols]
         return df
 
-    @sportsref.decorators.memoize
+    @sportsref.decorators.memoize(persist=True)
     def _get_player_stats_table(self, subpage, table_id):
         """Helper function for player season stats.
 
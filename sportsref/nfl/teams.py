@@ -87,7 +87,7 @@ class Team(future.utils.with_metaclass(sportsref.decorators.Cached, object)):
         return self.name()
 
     def __reduce__(self):
-        return Team, (self.teamID,)
+        return sportsref.decorators.reduce_instance(self, self.teamID)
 
     @sportsref.decorators.memoize
     def team_year_url(self, yr_str):
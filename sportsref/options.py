@@ -2,6 +2,23 @@ from __future__ import print_function
 OPTIONS = {
     'cache': True,
     'memoize': True,
+    # number of pooled keep-alive connections used for requests
+    'pool_size': 10,
+    # default number of results each memoized function keeps (None means
+    # unbounded); see sportsref.decorators.memoize
+    'memoize_maxsize': None,
+    # budget for the on-disk page cache (None means unlimited) and how to
+    # choose pages to evict when over budget: 'lru' or 'age_size'
+    'cache_max_bytes': None,
+    'cache_max_entries': None,
+    'cache_eviction': 'lru',
+    # store the parsed results of methods memoized with persist=True on disk,
+    # next to the page cache; see sportsref.decorators.memoize
+    'persist': True,
+    # pickle model objects (BoxScore, Player, etc.) along with the results of
+    # their memoized methods, e.g. to send parsed games between processes;
+    # see sportsref.decorators.reduce_instance
+    'pickle_results': False,
 }
 
 
@@ -1,47 +1,112 @@
 from __future__ import division, print_function, unicode_literals
 from builtins import object, str
 from past.builtins import basestring
+import collections
+import concurrent.futures
+import copy
 import ctypes
+import itertools
 import threading
 import multiprocessing
 import re
 import time
+import urllib.parse
 
+from lxml import etree
+import lxml.html
+import numpy as np
 import pandas as pd
 from pyquery import PyQuery as pq
 import requests
+import urllib3
 
 import sportsref
 
-# time between requests, in seconds
+try:
+    # async generators need Python 3.6+
+    from sportsref.aio import aget_html_many  # noqa: F401
+except SyntaxError:
+    pass
+
+# time between requests to the same host, in seconds
 THROTTLE_DELAY = 0.5
 
-# variables used to throttle requests across processes
+# per-host overrides of THROTTLE_DELAY, e.g.
+# {'www.basketball-reference.com': 1.0}
+HOST_THROTTLE_DELAYS = {}
+
+# variables used to throttle requests across processes; each known host has
+# its own send schedule, other hosts share last_request_time
 throttle_thread_lock = threading.Lock()
 throttle_process_lock = multiprocessing.Lock()
 last_request_time = multiprocessing.Value(ctypes.c_longdouble, time.time() - 10 * THROTTLE_DELAY)
+last_request_times = {
+    urllib.parse.urlparse(base_url).netloc:
+    multiprocessing.Value(ctypes.c_longdouble,
+                          time.time() - 10 * THROTTLE_DELAY)
+    for base_url in sportsref.SITE_ABBREV
+}
+
+# pooled keep-alive session shared by all requests in this process
+_session = None
+_session_pool_size = None
+_session_lock = threading.Lock()
+
+
+def _get_session():
+    """Returns the pooled requests.Session used for all requests, creating it
+    (or recreating it if the 'pool_size' option changed) when necessary.
+
+    :returns: requests.Session
+    """
+    global _session, _session_pool_size
+    pool_size = sportsref.get_option('pool_size')
+    with _session_lock:
+        if _session is None or _session_pool_size != pool_size:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=pool_size, pool_maxsize=pool_size
+            )
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            # negotiate every encoding urllib3 can decode (gzip, deflate, and
+            # brotli when a brotli package is installed)
+            session.headers['Accept-Encoding'] = (
+                urllib3.util.request.ACCEPT_ENCODING
+            )
+            _session, _session_pool_size = session, pool_size
+        return _session
 
 
 @sportsref.decorators.cache
-def get_html(url):
+def get_html(url, headers=None):
     """Gets the HTML for the given URL using a GET request.
 
     :url: the absolute URL of the desired page.
     :returns: a string of HTML.
     """
-    global last_request_time
-    with throttle_process_lock:
-        with throttle_thread_lock:
-            # sleep until THROTTLE_DELAY secs have passed since last request
-            wait_left = THROTTLE_DELAY - (time.time() - last_request_time.value)
-            if wait_left > 0:
-                time.sleep(wait_left)
+    _wait_for_send_slot(url)
+    response = _get_session().get(url, headers=headers)
+    return _html_from_response(url, response)
+
 
-            # make request
-            response = requests.get(url)
+def _html_from_response(url, response):
+    """Checks the status of a response and returns its HTML with comment
+    markers removed, along with its cache validators.
 
-            # update last request time for throttling
-            last_request_time.value = time.time()
+    :url: the URL that was requested.
+    :response: the requests.Response for that URL.
+    :returns: tuple of a string of HTML (None if the response was a 304 Not
+        Modified) and a dict of the response's ETag/Last-Modified headers.
+    """
+    validators = {
+        key: response.headers[header]
+        for key, header in (('etag', 'ETag'),
+                            ('last_modified', 'Last-Modified'))
+        if header in response.headers
+    }
+    if response.status_code == 304:
+        return None, validators
 
     # raise ValueError on 4xx status code, get rid of comments, and return
     if 400 <= response.status_code < 500:
@@ -52,10 +117,121 @@ def get_html(url):
     html = response.text
     html = html.replace('<!--', '').replace('-->', '')
 
-    return html
+    return html, validators
+
 
+def _wait_for_send_slot(url):
+    """Blocks until a request to the given URL may be sent.
 
-def parse_table(table, flatten=True, footer=False):
+    Requests to the same host must start at least THROTTLE_DELAY seconds (or
+    that host's entry in HOST_THROTTLE_DELAYS) apart. The next free send slot
+    for the host is reserved while holding the throttle locks, which are then
+    released before sleeping until that slot, so the latency of requests can
+    overlap across threads and processes without raising the request rate.
+
+    :url: the absolute URL about to be requested.
+    """
+    host = urllib.parse.urlparse(url).netloc
+    delay = HOST_THROTTLE_DELAYS.get(host, THROTTLE_DELAY)
+    host_last_request_time = last_request_times.get(host, last_request_time)
+    with throttle_process_lock:
+        with throttle_thread_lock:
+            send_time = max(time.time(),
+                            host_last_request_time.value + delay)
+            host_last_request_time.value = send_time
+    wait_left = send_time - time.time()
+    if wait_left > 0:
+        time.sleep(wait_left)
+
+
+def get_html_many(urls, max_workers=None, return_exceptions=False):
+    """Gets the HTML for many URLs concurrently with `get_html`, yielding each
+    page as soon as it is available. Requests are pipelined over the pooled
+    keep-alive session while still respecting the throttle between request
+    starts, and cached pages are not refetched. See also
+    :func:`sportsref.aio.aget_html_many` for use in async code.
+
+    :urls: iterable of absolute URLs; duplicates are only fetched once.
+    :max_workers: maximum number of requests in flight at once. Defaults to
+        the 'pool_size' option.
+    :return_exceptions: if True, an exception raised fetching a URL is
+        yielded in place of its HTML instead of being raised.
+    :returns: generator of (url, html) tuples in completion order.
+    """
+    if max_workers is None:
+        max_workers = sportsref.get_option('pool_size')
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+    futures = collections.OrderedDict(
+        (executor.submit(get_html, url), url)
+        for url in collections.OrderedDict.fromkeys(urls)
+    )
+    try:
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                html = future.result()
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                html = e
+            yield futures[future], html
+    finally:
+        # stop queued requests if the caller stops early or a request fails
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+# number of characters fed to the parser at a time by `extract_tables`
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def extract_tables(html, table_ids):
+    """Extracts tables from a page without building a DOM of the whole page.
+
+    Each table's opening tag is found by searching the HTML text, and only
+    the table itself is fed to the parser, incrementally, until its closing
+    tag; the rest of the page is never parsed.
+
+    :param html: a string of HTML, e.g. from `get_html`.
+    :param table_ids: iterable of the id attributes of the tables to extract.
+    :returns: dict mapping each table ID to a PyQuery object of the (first)
+        table with that ID, or an empty PyQuery object if there isn't one.
+    """
+    tables = {}
+    for table_id in table_ids:
+        m = re.search(
+            r'<(?i:table)\b[^>]*?\s(?i:id)\s*=\s*["\']?{}(?=["\'\s>])'
+            .format(re.escape(table_id)), html
+        )
+        tables[table_id] = _stream_table(html, m.start()) if m else pq([])
+    return tables
+
+
+def _stream_table(html, start):
+    """Parses the table whose opening tag starts at index `start` of `html`.
+
+    :returns: PyQuery object of the table.
+    """
+    # only tables generate events, so the parser doesn't have to call back
+    # into Python for every cell
+    parser = etree.HTMLPullParser(events=('start', 'end'), tag='table')
+    parser.set_element_class_lookup(lxml.html.HtmlElementClassLookup())
+    chunks = (html[i:i + STREAM_CHUNK_SIZE]
+              for i in range(start, len(html), STREAM_CHUNK_SIZE))
+    depth = 0
+    for chunk in itertools.chain(chunks, [None]):
+        if chunk is None:
+            parser.close()
+        else:
+            parser.feed(chunk)
+        for event, el in parser.read_events():
+            depth += 1 if event == 'start' else -1
+            if not depth:
+                return pq(el)
+    return pq([])
+
+
+def parse_table(table, flatten=True, footer=False, schema=None):
     """Parses a table from sports-reference sites into a pandas dataframe.
 
     :param table: the PyQuery object representing the HTML table
@@ -63,40 +239,113 @@ def parse_table(table, flatten=True, footer=False):
         all fields as text without cleaning.
     :param footer: If True, returns the summary/footer of the page. Recommended
         to use this with flatten=False. Defaults to False.
+    :param schema: optional dict mapping (cleaned) column names to 'float',
+        'percent', or 'salary'. Listed columns are converted as given instead
+        of having their type detected; only used when flattening.
     :returns: pd.DataFrame
     """
     if not len(table):
         return pd.DataFrame()
 
     # get columns
-    columns = [c.attrib['data-stat']
-               for c in table('thead tr:not([class]) th[data-stat]')]
-
-    # get data
-    rows = list(table('tbody tr' if not footer else 'tfoot tr')
-                .not_('.thead, .stat_total, .stat_average').items())
-    data = [
-        [flatten_links(td) if flatten else td.text()
-         for td in row.items('th,td')]
-        for row in rows
+    columns = [
+        th.attrib['data-stat'] for tbl in table
+        for th in tbl.xpath('.//thead//tr[not(@class)]//th[@data-stat]')
     ]
 
+    # get rows
+    skip_classes = {'thead', 'stat_total', 'stat_average'}
+    rows = [
+        tr for tbl in table
+        for tr in tbl.xpath('.//tfoot//tr' if footer else './/tbody//tr')
+        if not skip_classes.intersection((tr.get('class') or '').split())
+    ]
+
+    # get data in one pass over the cells: flattened values if flattening,
+    # and text if not flattening or if the text is needed for player names
+    # (like the flattened values, the names leave out notes)
+    keep_text = not flatten or 'player' in columns
+    values = [[] for _ in columns]
+    texts = [[] for _ in columns] if keep_text else None
+    row_cells = [list(tr.iter('th', 'td')) for tr in rows]
+    n_cells = max(len(cells) for cells in row_cells) if rows else 0
+    if rows and n_cells != len(columns):
+        raise ValueError('{} columns passed, passed data had {} columns'
+                         .format(len(columns), n_cells))
+    for cells in row_cells:
+        for i in range(len(columns)):
+            cell = cells[i] if i < len(cells) else None
+            if flatten:
+                values[i].append(
+                    flatten_element(cell) if cell is not None else None
+                )
+            if keep_text:
+                texts[i].append(
+                    element_text(cell, skip_notes=flatten)
+                    if cell is not None else None
+                )
+    row_classes = [tr.get('class') for tr in rows]
+
+    return _table_frame(columns, values if flatten else texts, row_classes,
+                        flatten, texts, schema)
+
+
+def _column_array(values):
+    """Returns a float array of a column's values if they can all be
+    converted, otherwise an object array."""
+    try:
+        return np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        arr = np.empty(len(values), dtype=object)
+        arr[:] = values
+        return arr
+
+
+def _is_text_dtype(dtype):
+    """Returns True for the dtypes pandas uses for columns of strings:
+    object, or the string dtype that newer pandas versions infer."""
+    return (pd.api.types.is_object_dtype(dtype) or
+            pd.api.types.is_string_dtype(dtype))
+
+
+def _table_frame(columns, values, row_classes, flatten, texts=None,
+                 schema=None):
+    """Builds and cleans the DataFrame for :func:`parse_table`.
+
+    :param columns: the data-stat of each column.
+    :param values: list with each column's cell values.
+    :param row_classes: the class attribute of each row, or None.
+    :param flatten: whether the values are flattened.
+    :param texts: list with each column's cell text; used for player names.
+    :param schema: see :func:`parse_table`.
+    :returns: pd.DataFrame
+    """
     # make DataFrame
-    df = pd.DataFrame(data, columns=columns, dtype='float')
-
-    # add has_class columns
-    allClasses = set(
-        cls
-        for row in rows
-        if row.attr['class']
-        for cls in row.attr['class'].split()
-    )
-    for cls in allClasses:
-        df['has_class_' + cls] = [
-            bool(row.attr['class'] and
-                 cls in row.attr['class'].split())
-            for row in rows
-        ]
+    if row_classes:
+        df = pd.DataFrame(
+            {i: _column_array(col) for i, col in enumerate(values)},
+            index=pd.RangeIndex(len(row_classes))
+        )
+        df.columns = columns
+    else:
+        df = pd.DataFrame([], columns=columns, dtype='float')
+
+    # add has_class columns, splitting each row's classes only once
+    row_class_lists = [row_class.split() if row_class else []
+                       for row_class in row_classes]
+    all_classes = sorted(set(
+        cls for class_list in row_class_lists for cls in class_list
+    ))
+    if all_classes:
+        class_idxs = {cls: i for i, cls in enumerate(all_classes)}
+        has_class = np.zeros((len(row_classes), len(all_classes)), dtype=bool)
+        for row_idx, class_list in enumerate(row_class_lists):
+            for cls in class_list:
+                has_class[row_idx, class_idxs[cls]] = True
+        df = pd.concat((df, pd.DataFrame(
+            has_class, index=df.index,
+            columns=['has_class_' + cls for cls in all_classes]
+        )), axis=1)
 
     # cleaning the DataFrame
 
@@ -120,9 +369,14 @@ def parse_table(table, flatten=True, footer=False):
             df.rename(columns={bs_id_col: 'boxscore_id'}, inplace=True)
             break
 
-    # ignore *, +, and other characters used to note things
-    df.replace(re.compile(r'[\*\+\u2605]', re.U), '', inplace=True)
-    for col in df.columns:
+    # ignore *, +, and other characters used to note things (only text
+    # columns can have them)
+    is_text = np.array([_is_text_dtype(dtype) for dtype in df.dtypes],
+                       dtype=bool)
+    if is_text.any():
+        df.iloc[:, is_text] = df.iloc[:, is_text].replace(
+            _NOTE_CHARS_RE, '')
+    for col in df.columns[is_text]:
         if hasattr(df[col], 'str'):
             df[col] = df[col].str.strip()
 
@@ -131,8 +385,11 @@ def parse_table(table, flatten=True, footer=False):
         if flatten:
             df.rename(columns={'player': 'player_id'}, inplace=True)
             # when flattening, keep a column for names
-            player_names = parse_table(table, flatten=False)['player_name']
-            df['player_name'] = player_names
+            player_names = pd.Series(texts[columns.index('player')],
+                                     index=pd.RangeIndex(len(row_classes)),
+                                     dtype=object)
+            df['player_name'] = (player_names
+                                 .replace(_NOTE_CHARS_RE, '').str.strip())
         else:
             df.rename(columns={'player': 'player_name'}, inplace=True)
 
@@ -163,7 +420,7 @@ def parse_table(table, flatten=True, footer=False):
         df.rename(columns={'game_location': 'is_home'}, inplace=True)
 
     # mp: (min:sec) -> float(min + sec / 60), notes -> NaN, new column
-    if 'mp' in df.columns and df.dtypes['mp'] == object and flatten:
+    if 'mp' in df.columns and _is_text_dtype(df.dtypes['mp']) and flatten:
         mp_df = df['mp'].str.extract(
             r'(?P<m>\d+):(?P<s>\d+)', expand=True).astype(float)
         no_match = mp_df.isnull().all(axis=1)
@@ -171,43 +428,110 @@ def parse_table(table, flatten=True, footer=False):
             df.loc[no_match, 'note'] = df.loc[no_match, 'mp']
         df['mp'] = mp_df['m'] + mp_df['s'] / 60
 
-    # converts number-y things to floats
-    def convert_to_float(val):
-        # percentages: (number%) -> float(number * 0.01)
-        m = re.search(r'([-\.\d]+)\%',
-                      val if isinstance(val, basestring) else str(val), re.U)
-        try:
-            if m:
-                return float(m.group(1)) / 100 if m else val
-            if m:
-                return int(m.group(1)) + int(m.group(2)) / 60
-        except ValueError:
-            return val
-        # salaries: $ABC,DEF,GHI -> float(ABCDEFGHI)
-        m = re.search(r'\$[\d,]+',
-                      val if isinstance(val, basestring) else str(val), re.U)
-        try:
-            if m:
-                return float(re.sub(r'\$|,', '', val))
-        except Exception:
-            return val
-        # generally try to coerce to float, unless it's an int or bool
-        try:
-            if isinstance(val, (int, bool)):
-                return val
-            else:
-                return float(val)
-        except Exception:
-            return val
+    columns_out = df.columns
 
+    # converts number-y things to floats
     if flatten:
-        df = df.applymap(convert_to_float)
+        schema = schema or {}
+        df = pd.DataFrame(
+            {i: _coerce_column(df.iloc[:, i], schema.get(col))
+             for i, col in enumerate(df.columns)},
+            index=df.index
+        )
+        df.columns = columns_out
 
     df = df.loc[df.astype(bool).any(axis=1)]
 
     return df
 
 
+_NOTE_CHARS_RE = re.compile(r'[\*\+\u2605]', re.U)
+_PERCENT_RE = re.compile(r'([-\.\d]+)\%', re.U)
+_SALARY_RE = re.compile(r'\$[\d,]+', re.U)
+_SALARY_CHARS = {ord('$'): None, ord(','): None}
+
+
+def _convert_to_float(val):
+    """Converts a number-y value to a float, or returns it unchanged."""
+    # percentages: (number%) -> float(number * 0.01)
+    m = _PERCENT_RE.search(val if isinstance(val, basestring) else str(val))
+    try:
+        if m:
+            return float(m.group(1)) / 100
+    except ValueError:
+        return val
+    # salaries: $ABC,DEF,GHI -> float(ABCDEFGHI)
+    m = _SALARY_RE.search(val if isinstance(val, basestring) else str(val))
+    try:
+        if m:
+            return float(re.sub(r'\$|,', '', val))
+    except Exception:
+        return val
+    # generally try to coerce to float, unless it's an int or bool
+    try:
+        if isinstance(val, (int, bool)):
+            return val
+        else:
+            return float(val)
+    except Exception:
+        return val
+
+
+def _coerce_column(col, kind=None):
+    """Converts a column's number-y values to floats, like applying
+    :func:`_convert_to_float` to each value but working on the whole column.
+
+    :param col: the column as a pd.Series.
+    :param kind: 'float', 'percent', or 'salary' to skip detecting the
+        column's type; None to detect it.
+    :returns: pd.Series
+    """
+    if kind == 'float':
+        return pd.to_numeric(col, errors='coerce').astype(float)
+    elif kind == 'percent':
+        if _is_text_dtype(col.dtype):
+            col = col.str.extract(_PERCENT_RE, expand=False)
+        return pd.to_numeric(col, errors='coerce') / 100
+    elif kind == 'salary':
+        if _is_text_dtype(col.dtype):
+            col = col.str.translate(_SALARY_CHARS)
+        return pd.to_numeric(col, errors='coerce').astype(float)
+    elif kind is not None:
+        raise ValueError('unknown column type "{}"'.format(kind))
+
+    # numbers, bools and empty columns stay as they are
+    if not _is_text_dtype(col.dtype) or not len(col):
+        return col
+
+    # plain numbers: a string with a % or $ can't be parsed as a float, so
+    # if the whole column parses, it has no percentages or salaries
+    if pd.api.types.infer_dtype(col, skipna=True) == 'string':
+        try:
+            return col.astype(float)
+        except ValueError:
+            pass
+        nonnull = col.dropna()
+        try:
+            # percentages: every value is just a number followed by %
+            if nonnull.str.match(r'[-\.\d]+%$').all():
+                return col.str.slice(stop=-1).astype(float) / 100
+            # salaries: every value is just a $ amount
+            if nonnull.str.match(r'\$[\d,]+$').all():
+                return col.str.translate(_SALARY_CHARS).astype(float)
+        except ValueError:
+            pass
+
+    # mixed columns: convert each distinct value once (missing values are
+    # left as they are)
+    codes, uniques = pd.factorize(col)
+    converted = np.empty(len(uniques), dtype=object)
+    converted[:] = [_convert_to_float(u) for u in uniques]
+    values = col.to_numpy(dtype=object, copy=True)
+    mask = codes >= 0
+    values[mask] = converted[codes[mask]]
+    return pd.Series(values, index=col.index, name=col.name).infer_objects()
+
+
 def parse_info_table(table):
     """Parses an info table, like the "Game Info" table or the "Officials"
     table on the PFR Boxscore page. Keys are lower case and have spaces/special
@@ -235,6 +559,76 @@ def parse_awards_table(table):
     return [flatten_links(tr) for tr in list(table('tr').items())]
 
 
+class PageTables(object):
+
+    """Index of the tables in a document by their id attribute. The index is
+    built on first access, and each table is only parsed once; later calls
+    return copies of the parsed result."""
+
+    def __init__(self, doc):
+        """Initializes a PageTables object.
+
+        :param doc: PyQuery object of the page.
+        """
+        self.doc = doc
+        self._index = None
+        self._parsed = {}
+        self._parse_locks = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, table_id):
+        return table_id in self._get_index()
+
+    def _get_index(self):
+        with self._lock:
+            if self._index is None:
+                index = collections.OrderedDict()
+                for table in self.doc('table[id]'):
+                    index.setdefault(table.get('id'), []).append(table)
+                self._index = index
+            return self._index
+
+    def ids(self):
+        """Returns the IDs of the tables on the page, in document order."""
+        return list(self._get_index())
+
+    def table(self, table_id):
+        """Returns the table(s) with the given ID.
+
+        :param table_id: the id attribute of the table.
+        :returns: PyQuery object; empty if there is no such table.
+        """
+        return pq(self._get_index().get(table_id, []))
+
+    def _parse(self, parser, table_id, **kwargs):
+        key = (parser.__name__, table_id, frozenset(kwargs.items()))
+        # only one thread parses a given table; the others wait for it
+        with self._lock:
+            parse_lock = self._parse_locks.setdefault(key, threading.RLock())
+        with parse_lock:
+            if key not in self._parsed:
+                self._parsed[key] = parser(self.table(table_id), **kwargs)
+        # DataFrames and dicts of scalars only need shallow copies
+        return self._parsed[key].copy()
+
+    def parse_table(self, table_id, **kwargs):
+        """Returns :func:`parse_table` of the table with the given ID.
+
+        :param table_id: the id attribute of the table.
+        :param kwargs: keyword arguments to :func:`parse_table`.
+        :returns: pd.DataFrame
+        """
+        return self._parse(parse_table, table_id, **kwargs)
+
+    def parse_info_table(self, table_id):
+        """Returns :func:`parse_info_table` of the table with the given ID.
+
+        :param table_id: the id attribute of the table.
+        :returns: dict
+        """
+        return self._parse(parse_info_table, table_id)
+
+
 def flatten_links(td, _recurse=False):
     """Flattens relative URLs within text of a table cell to IDs and returns
     the result.
@@ -261,7 +655,175 @@ def flatten_links(td, _recurse=False):
     return ''.join(_flatten_node(c) for c in td.contents())
 
 
-@sportsref.decorators.memoize
+# whitespace that PyQuery's .text() collapses; used to mirror its results
+_PQ_WHITESPACE_RE = re.compile('[\x20\x09\x0C\u200B\x0A\x0D]+')
+
+
+def _has_text(text):
+    """Returns True if PyQuery's .text() would be non-empty for an element
+    with the given text content."""
+    return bool(_PQ_WHITESPACE_RE.sub(' ', text).strip())
+
+
+def _is_note(el):
+    return (el.tag == 'span' and
+            'note' in (el.get('class') or '').split())
+
+
+def _visible_text(el):
+    """Returns the text content of an lxml element, skipping span.note
+    elements (but not the text following them)."""
+    parts = [el.text or '']
+    for child in el:
+        if not callable(child.tag) and not _is_note(child):
+            parts.append(_visible_text(child))
+        parts.append(child.tail or '')
+    return ''.join(parts)
+
+
+def _child_nodes(el):
+    """Returns the child text nodes and elements of an lxml element as
+    PyQuery's .contents() would after removing span.note elements: the text
+    after a note is merged into the text before it."""
+    nodes = []
+    if el.text:
+        nodes.append(el.text)
+    for child in el:
+        if not callable(child.tag) and _is_note(child):
+            if child.tail:
+                if nodes and isinstance(nodes[-1], basestring):
+                    nodes[-1] += child.tail
+                else:
+                    nodes.append(child.tail)
+            continue
+        nodes.append(child)
+        if child.tail:
+            nodes.append(child.tail)
+    return nodes
+
+
+def _remove_notes(el):
+    """Removes span.note elements below an lxml element, keeping the text
+    that follows them, like PyQuery's .remove('span.note')."""
+    for note in [c for c in el.iter('span') if _is_note(c)]:
+        parent = note.getparent()
+        if parent is None:
+            continue
+        if note.tail:
+            prev = note.getprevious()
+            if prev is None:
+                parent.text = (parent.text or '') + note.tail
+            else:
+                prev.tail = (prev.tail or '') + note.tail
+        parent.remove(note)
+
+
+def element_text(el, skip_notes=False):
+    """Returns the text of an lxml element, as PyQuery's .text() would.
+
+    :el: the lxml element.
+    :skip_notes: if True, leaves out the text of span.note elements, like
+        :func:`flatten_links` does.
+    :returns: the text, with whitespace collapsed and stripped.
+    """
+    # fast path for elements that only contain text
+    if not len(el) and el.tag != 'textarea':
+        return _PQ_WHITESPACE_RE.sub(' ', el.text or '').strip()
+    if skip_notes and any(_is_note(c) for c in el.iter('span')):
+        el = copy.deepcopy(el)
+        _remove_notes(el)
+    return pq(el).text()
+
+
+def flatten_element(el, _recurse=False):
+    """Flattens relative URLs within text of a table cell to IDs and returns
+    the result. Equivalent to :func:`flatten_links` for a single lxml element,
+    but leaves the element unchanged and avoids creating PyQuery objects.
+
+    :el: the lxml element for the HTML to convert
+    :returns: the string with the links flattened to IDs
+    """
+
+    # helper function to flatten individual strings/links
+    def _flatten_node(c):
+        if isinstance(c, basestring):
+            return c.strip()
+        elif callable(c.tag):
+            return ''
+        elif 'href' in c.attrib:
+            c_id = rel_url_to_id(c.attrib['href'])
+            return c_id if c_id else _visible_text(c).strip()
+        else:
+            return flatten_element(c, _recurse=True)
+
+    # fast path for elements that only contain text
+    if not len(el):
+        text = el.text or ''
+        if not _has_text(text):
+            return '' if _recurse else None
+        return text.strip()
+
+    # if there's no text, just return None
+    text = _visible_text(el) if _recurse else el.xpath('string()')
+    if not _has_text(text):
+        return '' if _recurse else None
+
+    return ''.join(_flatten_node(c) for c in _child_nodes(el))
+
+
+def _compile_id_regexes():
+    """Returns a list of the regexes used by :func:`rel_url_to_id`, in the
+    order they're tried, each with the URL path segments it requires."""
+    yearRegex = r'.*/years/(\d{4}).*|.*/gamelog/(\d{4}).*'
+    playerRegex = r'.*/players/(?:\w/)?(.+?)(?:/|\.html?)'
+    boxscoresRegex = r'.*/boxscores/(.+?)\.html?'
+    teamRegex = r'.*/teams/(\w{3})/.*'
+    coachRegex = r'.*/coaches/(.+?)\.html?'
+    stadiumRegex = r'.*/stadiums/(.+?)\.html?'
+    refRegex = r'.*/officials/(.+?r)\.html?'
+    collegeRegex = r'.*/schools/(\S+?)/.*|.*college=([^&]+)'
+    hsRegex = r'.*/schools/high_schools\.cgi\?id=([^\&]{8})'
+    bsDateRegex = r'.*/boxscores/index\.f?cgi\?(month=\d+&day=\d+&year=\d+)'
+    leagueRegex = r'.*/leagues/(.*_\d{4}).*'
+    awardRegex = r'.*/awards/(.+)\.htm'
+
+    regexes = [
+        (('years', 'gamelog'), yearRegex),
+        (('players',), playerRegex),
+        (('boxscores',), boxscoresRegex),
+        (('teams',), teamRegex),
+        (('coaches',), coachRegex),
+        (('stadiums',), stadiumRegex),
+        (('officials',), refRegex),
+        (('schools', 'college='), collegeRegex),
+        (('schools',), hsRegex),
+        (('boxscores',), bsDateRegex),
+        (('leagues',), leagueRegex),
+        (('awards',), awardRegex),
+    ]
+    return [(segments, re.compile(regex, re.I))
+            for segments, regex in regexes]
+
+
+ID_REGEXES = _compile_id_regexes()
+
+# maps each path segment (and 'college=') to the indices of the ID regexes
+# that need it; a URL only has to be tried against the regexes for the
+# segments it contains
+ID_ROUTES = {}
+for idx, (segments, _) in enumerate(ID_REGEXES):
+    for segment in segments:
+        ID_ROUTES.setdefault(segment, []).append(idx)
+del idx, segments, segment
+
+_ID_SEGMENT_RE = re.compile(
+    r'/({})(?=/)|(college=)'.format('|'.join(
+        re.escape(segment) for segment in ID_ROUTES if segment != 'college='
+    )), re.I
+)
+
+
+@sportsref.decorators.memoize(maxsize=4096, frozen=True)
 def rel_url_to_id(url):
     """Converts a relative URL to a unique ID.
 
@@ -284,36 +846,11 @@ def rel_url_to_id(url):
 
     :returns: ID associated with the given relative URL.
     """
-    yearRegex = r'.*/years/(\d{4}).*|.*/gamelog/(\d{4}).*'
-    playerRegex = r'.*/players/(?:\w/)?(.+?)(?:/|\.html?)'
-    boxscoresRegex = r'.*/boxscores/(.+?)\.html?'
-    teamRegex = r'.*/teams/(\w{3})/.*'
-    coachRegex = r'.*/coaches/(.+?)\.html?'
-    stadiumRegex = r'.*/stadiums/(.+?)\.html?'
-    refRegex = r'.*/officials/(.+?r)\.html?'
-    collegeRegex = r'.*/schools/(\S+?)/.*|.*college=([^&]+)'
-    hsRegex = r'.*/schools/high_schools\.cgi\?id=([^\&]{8})'
-    bsDateRegex = r'.*/boxscores/index\.f?cgi\?(month=\d+&day=\d+&year=\d+)'
-    leagueRegex = r'.*/leagues/(.*_\d{4}).*'
-    awardRegex = r'.*/awards/(.+)\.htm'
-
-    regexes = [
-        yearRegex,
-        playerRegex,
-        boxscoresRegex,
-        teamRegex,
-        coachRegex,
-        stadiumRegex,
-        refRegex,
-        collegeRegex,
-        hsRegex,
-        bsDateRegex,
-        leagueRegex,
-        awardRegex,
-    ]
-
-    for regex in regexes:
-        match = re.match(regex, url, re.I)
+    route_idxs = set()
+    for m in _ID_SEGMENT_RE.finditer(url):
+        route_idxs.update(ID_ROUTES[(m.group(1) or m.group(2)).lower()])
+    for idx in sorted(route_idxs):
+        match = ID_REGEXES[idx][1].match(url)
         if match:
             return [_f for _f in match.groups() if _f][0]
 
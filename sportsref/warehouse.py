@@ -0,0 +1,157 @@
+"""Offline snapshots of whole seasons as partitioned Parquet datasets.
+
+`build` parses every game of a season through the BoxScore APIs and writes
+the games, player_box, team_box and pbp datasets under
+<path>/<sport>/<dataset>/season=<year>/; `load` reads them back, memory-mapped
+and with only the requested columns and seasons. Requires pyarrow, which
+is installed with the 'warehouse' extra (pip install sportsref[warehouse]).
+"""
+from __future__ import print_function
+import os
+
+import pandas as pd
+
+import sportsref
+
+WAREHOUSE_DIR = os.path.join(sportsref.cache.CACHE_DIR, 'warehouse')
+
+DATASETS = ('games', 'player_box', 'team_box', 'pbp')
+
+
+def _get_parquet():
+    try:
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError('sportsref.warehouse requires pyarrow '
+                          '(pip install sportsref[warehouse])')
+    return pyarrow.parquet
+
+
+def _nba_games(bs):
+    return pd.DataFrame({
+        'boxscore_id': [bs.boxscore_id],
+        'date': [bs.date()],
+        'home': [bs.home()],
+        'away': [bs.away()],
+        'home_score': [bs.home_score()],
+        'away_score': [bs.away_score()],
+    })
+
+
+def _nba_team_box(bs):
+    df = bs.linescore().rename_axis('side').reset_index()
+    df['is_home'] = df['side'] == 'home'
+    return df.drop('side', axis=1)
+
+
+# functions returning each dataset's rows for a BoxScore
+_DATASET_FUNCS = {
+    'nfl': {
+        'games': lambda bs: bs.game_info(),
+        'player_box': lambda bs: bs.player_stats(),
+        'team_box': lambda bs: bs.stats_team(),
+        'pbp': lambda bs: bs.pbp(),
+    },
+    'nba': {
+        'games': _nba_games,
+        'player_box': lambda bs: bs.basic_stats(),
+        'team_box': _nba_team_box,
+        'pbp': lambda bs: bs.pbp(),
+    },
+}
+
+
+def _boxscore(sport, boxscore_id):
+    return getattr(sportsref, sport).BoxScore(boxscore_id)
+
+
+def _arrow_safe(df):
+    """Converts text columns that Parquet can't store as-is, because they
+    mix types, to numbers if they are all numbers and to strings
+    otherwise."""
+    df = df.copy()
+    is_text = [sportsref.utils._is_text_dtype(dtype) for dtype in df.dtypes]
+    for col in df.columns[is_text]:
+        kind = pd.api.types.infer_dtype(df[col], skipna=True)
+        if kind in ('integer', 'floating', 'mixed-integer-float', 'decimal'):
+            df[col] = pd.to_numeric(df[col])
+        elif kind not in ('string', 'empty', 'boolean', 'date', 'datetime'):
+            df[col] = df[col].where(df[col].isnull(), df[col].astype(str))
+    return df
+
+
+def build(sport, season, path=None, datasets=DATASETS):
+    """Parses every game of a season and writes it to the warehouse. Games
+    that fail to parse are skipped with a warning. Rebuilding a season
+    replaces it.
+
+    :sport: 'nfl' or 'nba'.
+    :season: the year of the season.
+    :path: root directory of the warehouse; defaults to WAREHOUSE_DIR.
+    :datasets: names of the datasets to build; defaults to all of them.
+    :returns: dict mapping each dataset name to its number of rows.
+    """
+    _get_parquet()
+    if sport not in _DATASET_FUNCS:
+        raise ValueError('unknown sport "{}"'.format(sport))
+    path = path or WAREHOUSE_DIR
+    funcs = _DATASET_FUNCS[sport]
+
+    frames = {name: [] for name in datasets}
+    for bs_id in sportsref.crawl.boxscore_ids(sport, season):
+        bs = _boxscore(sport, bs_id)
+        for name in datasets:
+            try:
+                df = funcs[name](bs).copy()
+            except Exception as e:
+                print('WARNING: skipping {} for {}: {!r}'
+                      .format(name, bs_id, e))
+                continue
+            if 'boxscore_id' not in df.columns:
+                df['boxscore_id'] = bs_id
+            frames[name].append(df)
+
+    n_rows = {}
+    for name, dfs in frames.items():
+        df = (pd.concat(dfs, ignore_index=True, sort=False) if dfs
+              else pd.DataFrame({'boxscore_id': []}))
+        # the season comes from the partition directory
+        df = _arrow_safe(df.drop('season', axis=1, errors='ignore'))
+        out_dir = os.path.join(path, sport, name, 'season={}'.format(season))
+        if not os.path.isdir(out_dir):
+            os.makedirs(out_dir)
+        df.to_parquet(os.path.join(out_dir, 'part-0.parquet'),
+                      engine='pyarrow', index=False)
+        n_rows[name] = len(df)
+    return n_rows
+
+
+def load(sport, dataset, seasons=None, columns=None, filters=None,
+         path=None):
+    """Reads a dataset from the warehouse. Files are memory-mapped, and only
+    the requested columns and the partitions of the requested seasons are
+    read.
+
+    :sport: 'nfl' or 'nba'.
+    :dataset: one of DATASETS.
+    :seasons: iterable of the seasons to read; None reads all of them.
+    :columns: list of the columns to read; None reads all of them.
+    :filters: other row filters, in pyarrow.parquet.read_table's format,
+        e.g. [('team', '=', 'nwe')].
+    :path: root directory of the warehouse; defaults to WAREHOUSE_DIR.
+    :returns: pd.DataFrame
+    """
+    parquet = _get_parquet()
+    if dataset not in DATASETS:
+        raise ValueError('unknown dataset "{}"'.format(dataset))
+    root = os.path.join(path or WAREHOUSE_DIR, sport, dataset)
+    filters = list(filters or [])
+    if seasons is not None:
+        filters.append(('season', 'in', [int(s) for s in seasons]))
+    table = parquet.read_table(root, columns=columns,
+                               filters=filters or None,
+                               memory_map=True, partitioning='hive')
+    df = table.to_pandas()
+    if 'season' in df.columns:
+        df['season'] = df['season'].astype(int)
+    return df
@@ -0,0 +1,145 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from sportsref.nba import pbp
+
+
+def _baseline_collapse_redundant_subs(df, poss_ids):
+    """The iterrows loop collapse_redundant_subs replaced in BoxScore.pbp."""
+    df = df.copy()
+    for (se, tm, pnum), group in df[df.is_sub].groupby(
+        [df.secs_elapsed, df.sub_team, poss_ids]
+    ):
+        if len(group) > 1:
+            sub_in = set()
+            sub_out = set()
+            for i, row in group.iterrows():
+                if row['sub_in'] in sub_out:
+                    sub_out.remove(row['sub_in'])
+                else:
+                    sub_in.add(row['sub_in'])
+                if row['sub_out'] in sub_in:
+                    sub_in.remove(row['sub_out'])
+                else:
+                    sub_out.add(row['sub_out'])
+            n_subs = len(sub_in)
+            for idx, p_in, p_out in zip(group.index[:n_subs], sub_in,
+                                        sub_out):
+                df.loc[idx, 'sub_in'] = p_in
+                df.loc[idx, 'sub_out'] = p_out
+                df.loc[idx, 'detail'] = (
+                    '{} enters the game for {}'.format(p_in, p_out)
+                )
+            n_extra = len(group) - len(sub_in)
+            if n_extra:
+                df.drop(group.index[-n_extra:], axis=0, inplace=True)
+    return df
+
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
+
+
+def _sub_fixture():
+    """Reads a game's substitutions and the plays around them, as laid out
+    by BoxScore.pbp before collapse_redundant_subs, with their
+    possession IDs."""
+    df = pd.read_csv(os.path.join(DATA_DIR, 'nba_subs.csv'), dtype=object)
+    df['secs_elapsed'] = df.secs_elapsed.astype(float)
+    df['quarter'] = df.quarter.astype(int)
+    df['is_sub'] = df.is_sub == 'True'
+    poss_ids = df.pop('poss_id_reb').astype(int)
+    return df, poss_ids
+
+
+def _sub_frame(subs):
+    """Builds play-by-play rows from (secs_elapsed, team, sub_in, sub_out)
+    tuples, with a non-sub play before each distinct time."""
+    rows = []
+    for se, tm, p_in, p_out in subs:
+        if not rows or rows[-1]['secs_elapsed'] != se:
+            rows.append({'secs_elapsed': se, 'is_sub': False,
+                         'sub_team': np.nan, 'sub_in': np.nan,
+                         'sub_out': np.nan, 'detail': 'play'})
+        rows.append({'secs_elapsed': se, 'is_sub': True, 'sub_team': tm,
+                     'sub_in': p_in, 'sub_out': p_out,
+                     'detail': '{} enters the game for {}'.format(p_in,
+                                                                  p_out)})
+    df = pd.DataFrame(rows)
+    # every time is its own possession
+    poss_ids = pd.Series(pd.factorize(df.secs_elapsed)[0], index=df.index)
+    return df, poss_ids
+
+
+def _net_subs(df):
+    subs = df[df.is_sub]
+    return {(se, tm): (sorted(g.sub_in), sorted(g.sub_out))
+            for (se, tm), g in subs.groupby(['secs_elapsed', 'sub_team'])}
+
+
+def test_collapse_redundant_subs_pairs_in_order_of_appearance():
+    df, poss_ids = _sub_frame([
+        (10., 'BOS', 'a', 'b'),
+        (10., 'BOS', 'c', 'd'),
+        (10., 'BOS', 'b', 'a'),
+        (10., 'BOS', 'e', 'f'),
+    ])
+    result = pbp.collapse_redundant_subs(df.copy(), poss_ids.values)
+    subs = result[result.is_sub]
+    assert list(subs.index) == [1, 2]
+    assert list(zip(subs.sub_in, subs.sub_out)) == [('c', 'd'), ('e', 'f')]
+    assert list(subs.detail) == ['c enters the game for d',
+                                 'e enters the game for f']
+
+
+def test_collapse_redundant_subs_fixture():
+    df, poss_ids = _sub_fixture()
+    result = pbp.collapse_redundant_subs(df.copy(), poss_ids.values)
+    subs = result[result.is_sub]
+    # same-clock in and out cancel, a chain of subs collapses to its net
+    # effect, and subs in different possessions across the end of a period
+    # are kept
+    assert list(subs.index) == [3, 5, 6, 9, 10]
+    assert list(zip(subs.sub_in, subs.sub_out)) == [
+        ('playerq01', 'playerk01'),
+        ('playerh01', 'playerb01'),
+        ('playerf01', 'playerc01'),
+        ('playeri01', 'playerd01'),
+        ('playerd01', 'playeri01'),
+    ]
+    assert (result.loc[~result.is_sub, 'detail'] ==
+            df.loc[~df.is_sub, 'detail']).all()
+
+    expected = _baseline_collapse_redundant_subs(df, poss_ids)
+    assert list(result.index) == list(expected.index)
+    assert _net_subs(result) == _net_subs(expected)
+
+
+def test_collapse_redundant_subs_matches_baseline():
+    rng = np.random.RandomState(0)
+    for _ in range(50):
+        # each team has five of its eight players on the court
+        on_court = {tm: ['{}{}'.format(tm, i) for i in range(5)]
+                    for tm in ['BOS', 'NYK']}
+        bench = {tm: ['{}{}'.format(tm, i) for i in range(5, 8)]
+                 for tm in ['BOS', 'NYK']}
+        subs = []
+        for se in range(1, 6):
+            for tm in ['BOS', 'NYK']:
+                for _ in range(rng.randint(0, 4)):
+                    i = rng.randint(len(bench[tm]))
+                    j = rng.randint(len(on_court[tm]))
+                    p_in, p_out = bench[tm][i], on_court[tm][j]
+                    bench[tm][i], on_court[tm][j] = p_out, p_in
+                    subs.append((float(se), tm, p_in, p_out))
+        if not subs:
+            continue
+        df, poss_ids = _sub_frame(subs)
+        expected = _baseline_collapse_redundant_subs(df, poss_ids)
+        result = pbp.collapse_redundant_subs(df.copy(), poss_ids.values)
+        assert list(result.index) == list(expected.index)
+        assert (result.is_sub == expected.is_sub).all()
+        # the old loop paired the net subs in set order, so only the players
+        # subbed in and out at each time are compared
+        assert _net_subs(result) == _net_subs(expected)